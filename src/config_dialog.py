@@ -104,8 +104,7 @@ def _draw_color_swatch(area, ctx, w, h, rgba_str_ptr):
 
 def on_custom_color_button_clicked(button, color_ptr, drawing_area):
     """Opens the custom singleton color dialog."""
-    # Defer import to avoid circular dependency:
-    # config_dialog -> ui_color_dialog -> ui_helpers -> config_dialog
+    # Deferred so the color dialog module is only loaded once a color is picked
     from ui_color_dialog import ColorChooserDialog
     
     dialog = ColorChooserDialog(button.get_ancestor(Gtk.Window))
@@ -144,10 +143,12 @@ class ConfigOption:
         self.dynamic_group = dynamic_group
         self.dynamic_show_on = dynamic_show_on
 
-def build_ui_from_model(parent_box, config, model, widgets=None):
+def build_ui_from_model(parent_box, config, model, widgets=None, populate_defaults=False):
     """
     Populates a parent Gtk.Box with widgets based on a configuration model.
     It can now automatically create Gtk.Stack widgets for dynamic options.
+    With populate_defaults, missing config values are filled from the model
+    while it is walked, like populate_defaults_from_model.
     """
     if widgets is None:
         widgets = {}
@@ -160,6 +161,8 @@ def build_ui_from_model(parent_box, config, model, widgets=None):
         for section_title, options in model.items():
             static_group = all_static_options.setdefault(section_title, [])
             for option in options:
+                if populate_defaults:
+                    config.setdefault(option.key, str(option.default))
                 if option.dynamic_group:
                     controller_key = option.dynamic_group
                     dynamic_controller_group = all_dynamic_options.setdefault(controller_key, {})
@@ -20,6 +20,10 @@ class ConfigManager:
         os.makedirs(os.path.dirname(DEFAULT_CONFIG_FILE), exist_ok=True)
         self.config = configparser.ConfigParser(interpolation=None)
         self.config.optionxform = str 
+        # Startup-only [GridLayout] values, parsed once per successful load()
+        self.grid_layout = {'launch_fullscreen': False, 'fullscreen_display_index': -1}
+        # Bumped whenever [GridLayout] may have changed so cached parses can be refreshed
+        self.grid_style_version = 0
         self.load() 
         
         self.theme_config = configparser.ConfigParser(interpolation=None)
@@ -30,6 +34,7 @@ class ConfigManager:
         # --- Debounce State ---
         self._save_timer = None
         self._save_lock = threading.Lock()
+        self._dirty_flush_id = None
 
     def load(self, filepath=None):
         load_path = filepath if filepath else DEFAULT_CONFIG_FILE
@@ -41,6 +46,7 @@ class ConfigManager:
             try:
                 self.config.read(load_path, encoding='utf-8')
                 print(f"Configuration loaded from {load_path}")
+                self._parse_grid_layout()
                 return True
             except configparser.Error as e:
                 print(f"Error reading config file {load_path}: {e}. Restoring previous config (if any).")
@@ -55,38 +61,108 @@ class ConfigManager:
                 self.config = current_config_backup 
                 return False
             print("A new default configuration will be created on save.")
+            self._parse_grid_layout()
             return True
 
+    def invalidate_grid_style(self):
+        """Marks values parsed from [GridLayout] (e.g. panel border style) as stale."""
+        self.grid_style_version += 1
+
+    def _parse_grid_layout(self):
+        """Parses the [GridLayout] values read at startup into plain Python types."""
+        self.invalidate_grid_style()
+        section = self.config["GridLayout"] if self.config.has_section("GridLayout") else {}
+        try:
+            display_index = int(section.get("fullscreen_display_index", -1))
+        except (ValueError, TypeError):
+            print(f"Invalid fullscreen_display_index '{section.get('fullscreen_display_index')}'. Using the default display.")
+            display_index = -1
+        self.grid_layout = {
+            'launch_fullscreen': str(section.get("launch_fullscreen", "False")).lower() == 'true',
+            'fullscreen_display_index': display_index,
+        }
+
     def save(self, filepath=None, immediate=False):
         """
         Saves configuration safely.
         """
-        # Serialize config to string immediately (Main Thread)
+        # Snapshot the config immediately (Main Thread)
         # This prevents race conditions where self.config is modified 
         # while the background thread is writing it.
-        config_data = io.StringIO()
-        self.config.write(config_data)
-        serialized_data = config_data.getvalue()
-        config_data.close()
+        snapshot = self._snapshot()
 
         target_path = filepath if filepath else DEFAULT_CONFIG_FILE
 
         if filepath or immediate:
+            if self._dirty_flush_id:
+                GLib.source_remove(self._dirty_flush_id)
+                self._dirty_flush_id = None
             with self._save_lock:
                 if self._save_timer:
                     self._save_timer.cancel()
                     self._save_timer = None
-            return self._write_to_disk(target_path, serialized_data)
+            return self.save_from_snapshot(snapshot, target_path)
             
         # Debounce logic for background saves
+        self._schedule_write(target_path, snapshot, 1.0)
+        return True
+
+    def mark_dirty(self):
+        """
+        Flags the configuration as modified without serializing it. Changes
+        made in quick succession are coalesced into a single background save
+        once no further change has been marked for 500 ms.
+        """
+        if self._dirty_flush_id:
+            GLib.source_remove(self._dirty_flush_id)
+        self._dirty_flush_id = GLib.timeout_add(500, self._flush_dirty)
+
+    def flush_pending(self):
+        """
+        Writes changes flagged by mark_dirty() synchronously instead of waiting
+        for the debounce timeout. Called on shutdown, when the main loop will
+        no longer dispatch it.
+        """
+        if not self._dirty_flush_id:
+            return
+        GLib.source_remove(self._dirty_flush_id)
+        self._dirty_flush_id = None
+        with self._save_lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+        self.save_from_snapshot(self._snapshot(), DEFAULT_CONFIG_FILE)
+
+    def _flush_dirty(self):
+        self._dirty_flush_id = None
+        self._schedule_write(DEFAULT_CONFIG_FILE, self._snapshot(), 0)
+        return GLib.SOURCE_REMOVE
+
+    def _snapshot(self):
+        """Copies the current config into plain dicts that no other code mutates."""
+        return {section: dict(self.config.items(section, raw=True)) for section in self.config.sections()}
+
+    def _schedule_write(self, target_path, snapshot, delay):
+        """Replaces any pending background write with one for snapshot."""
         with self._save_lock:
             if self._save_timer:
                 self._save_timer.cancel()
             
-            # Pass the PRE-SERIALIZED data to the thread
-            self._save_timer = threading.Timer(1.0, self._write_to_disk, args=[target_path, serialized_data])
+            # Pass the snapshot to the thread; it never touches self.config
+            self._save_timer = threading.Timer(delay, self.save_from_snapshot, args=[snapshot, target_path])
             self._save_timer.start()
-        return True
+
+    def save_from_snapshot(self, snapshot, save_path):
+        """Serializes a snapshot from _snapshot() on a fresh parser and writes it to save_path."""
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.optionxform = str
+        parser.read_dict(snapshot)
+
+        config_data = io.StringIO()
+        parser.write(config_data)
+        serialized_data = config_data.getvalue()
+        config_data.close()
+        return self._write_to_disk(save_path, serialized_data)
 
     def _write_to_disk(self, save_path, data_string):
         """Helper to perform the actual synchronous write operation using pre-serialized data."""
@@ -218,16 +294,14 @@ class ConfigManager:
             if key in panel_config:
                 defaults_to_save[key] = panel_config[key]
         
-        prefixes_to_check = []
+        prefixes_to_check = ()
         if hasattr(displayer_class, 'get_config_key_prefixes'):
-            prefixes_to_check = displayer_class.get_config_key_prefixes()
+            prefixes_to_check = tuple(displayer_class.get_config_key_prefixes())
 
         if prefixes_to_check:
             for key, value in panel_config.items():
-                for prefix in set(prefixes_to_check): 
-                    if key.startswith(prefix):
-                        defaults_to_save[key] = value
-                        break 
+                if key.startswith(prefixes_to_check):
+                    defaults_to_save[key] = value
 
         section_name = f"defaults_{displayer_key}"
         if self.theme_config.has_section(section_name):
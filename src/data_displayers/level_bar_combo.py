@@ -208,8 +208,7 @@ class LevelBarComboDisplayer(ComboBase):
                         ))
                     prefixed_model[section] = prefixed_options
                 
-                populate_defaults_from_model(panel_config, prefixed_model)
-                build_ui_from_model(tab_box, panel_config, prefixed_model, widgets)
+                build_ui_from_model(tab_box, panel_config, prefixed_model, widgets, populate_defaults=True)
                 dialog.dynamic_models.append(prefixed_model)
 
                 # --- FIX: Manually invoke the visibility callback for each bar ---
@@ -96,6 +96,7 @@ class DataPanel(BasePanel):
             self.content_area.remove(self.content_area.get_first_child())
         
         self.content_area.append(self.data_displayer.get_widget())
+        self._graph_area = getattr(self.data_displayer, 'graph_area', None)
         
     def apply_all_configurations(self):
         self.data_source.config = self.config
@@ -123,6 +124,7 @@ class DataPanel(BasePanel):
         if self.data_displayer:
             self.data_displayer.close()
             self.data_displayer = None
+            self._graph_area = None
             
         if self.data_source:
             if hasattr(self.data_source, 'close'):
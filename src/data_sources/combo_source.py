@@ -6,6 +6,7 @@ from functools import partial
 from data_source import DataSource
 from config_dialog import ConfigOption, build_ui_from_model, get_config_from_widgets
 from utils import populate_defaults_from_model
+from module_registry import resolve_class
 
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, GLib
@@ -38,7 +39,7 @@ class ComboDataSource(DataSource):
             self.child_sources.clear()
             
             sources_iterable = available_sources.values() if isinstance(available_sources, dict) else available_sources
-            source_map = {info['key']: info['class'] for info in sources_iterable}
+            source_map = {info['key']: info for info in sources_iterable}
             
             mode = self.config.get('combo_mode', 'arc')
 
@@ -47,7 +48,8 @@ class ComboDataSource(DataSource):
                 source_key = self.config.get(f"{slot_prefix}source")
                 
                 if source_key and source_key != "none":
-                    SourceClass = source_map.get(source_key)
+                    source_info = source_map.get(source_key)
+                    SourceClass = resolve_class(source_info) if source_info else None
                     if SourceClass:
                         child_config = {}
                         populate_defaults_from_model(child_config, SourceClass.get_config_model())
@@ -148,7 +150,8 @@ class ComboDataSource(DataSource):
 
             if source_key and source_key != "none":
                 sources_iterable = available_sources.values() if isinstance(available_sources, dict) else available_sources
-                SourceClass = next((s['class'] for s in sources_iterable if s['key'] == source_key), None)
+                source_info = next((s for s in sources_iterable if s['key'] == source_key), None)
+                SourceClass = resolve_class(source_info) if source_info else None
                 if SourceClass:
                     model = SourceClass.get_config_model()
                     child_config = {}
@@ -16,15 +16,7 @@ class GPUDataSource(DataSource):
         Fetches a dictionary of all metrics for the selected GPU.
         """
         gpu_index = int(self.config.get("gpu_index", "0"))
-        return {
-            "temperature": gpu_manager.get_temperature(gpu_index),
-            "utilization": gpu_manager.get_utilization(gpu_index),
-            "frequency": gpu_manager.get_graphics_clock(gpu_index),
-            "vram": gpu_manager.get_vram_usage(gpu_index),
-            "power": gpu_manager.get_power_usage(gpu_index),
-            "fan_speed": gpu_manager.get_fan_speed(gpu_index),
-            "processes": gpu_manager.get_running_processes_count(gpu_index)
-        }
+        return gpu_manager.poll_all(gpu_index)
 
     def get_numerical_value(self, data):
         """
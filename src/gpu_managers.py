@@ -170,5 +170,37 @@ class GPUManager:
             return self.nvml_manager.get_running_processes_count(original_index)
         return None
 
+    def poll_all(self, gpu_index):
+        """
+        Returns all metrics for a GPU as a dictionary. NVIDIA GPUs are read in
+        a single NVML pass; other vendors are served from their per-cycle cache.
+        """
+        vendor, original_index = self._get_gpu_info(gpu_index)
+        if vendor == "nvidia":
+            snap = self.nvml_manager.poll_all(original_index)
+            if snap is None:
+                return dict.fromkeys(("temperature", "utilization", "frequency", "vram", "power", "fan_speed", "processes"))
+            vram = None
+            if snap.mem_percent is not None:
+                vram = {"percent": snap.mem_percent, "used_gb": snap.mem_used_gb, "total_gb": snap.mem_total_gb}
+            return {
+                "temperature": snap.temperature,
+                "utilization": snap.utilization,
+                "frequency": snap.gfx_clock,
+                "vram": vram,
+                "power": snap.power_w,
+                "fan_speed": snap.fan_pct,
+                "processes": snap.proc_count
+            }
+        return {
+            "temperature": self.get_temperature(gpu_index),
+            "utilization": self.get_utilization(gpu_index),
+            "frequency": self.get_graphics_clock(gpu_index),
+            "vram": self.get_vram_usage(gpu_index),
+            "power": self.get_power_usage(gpu_index),
+            "fan_speed": self.get_fan_speed(gpu_index),
+            "processes": self.get_running_processes_count(gpu_index)
+        }
+
 # Create a single global instance of the unified manager
 gpu_manager = GPUManager()
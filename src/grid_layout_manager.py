@@ -10,6 +10,7 @@ import configparser
 from config_dialog import ConfigOption, build_ui_from_model, get_config_from_widgets
 from ui_helpers import build_background_config_ui, CustomDialog
 from data_panel import DataPanel
+from module_registry import resolve_class
 import math
 
 CELL_SIZE = 16
@@ -20,11 +21,10 @@ class GridLayoutManager(Gtk.Fixed):
     deletion, drag-and-drop, multi-selection with a rubberband,
     and the overall background appearance.
     """
-    def __init__(self, available_sources, available_displayers, all_source_classes):
+    def __init__(self, available_sources, available_displayers):
         super().__init__()
         self.AVAILABLE_DATA_SOURCES = available_sources
         self.AVAILABLE_DISPLAYERS = available_displayers
-        self.ALL_SOURCE_CLASSES = all_source_classes
         
         self.panel_positions = {}
         self.panel_sizes = {}
@@ -132,12 +132,49 @@ class GridLayoutManager(Gtk.Fixed):
                 self.remove(widget)
                 self.put(widget, x_pos * CELL_SIZE, y_pos * CELL_SIZE)
 
+        # Re-parenting resets child visibility
+        self._update_panel_visibility()
+
     def set_scroll_adjustments(self, hadjustment, vadjustment):
         self._h_adjustment = hadjustment
         self._v_adjustment = vadjustment
         if hadjustment:
             hadjustment.connect("changed", self.check_and_update_scrolling_state)
             hadjustment.connect("value-changed", self.check_and_update_scrolling_state)
+        for adjustment in (hadjustment, vadjustment):
+            if adjustment:
+                adjustment.connect("changed", self._update_panel_visibility)
+                adjustment.connect("value-changed", self._update_panel_visibility)
+
+    def _update_panel_visibility(self, *args):
+        """
+        Marks panels lying entirely outside the scrolled viewport (plus a small
+        margin) as child-invisible, so GTK does not allocate, map or draw them.
+        Panels keep their position and config and reappear as they scroll in.
+        """
+        if not self._h_adjustment or not self._v_adjustment:
+            return
+        page_w = self._h_adjustment.get_page_size()
+        page_h = self._v_adjustment.get_page_size()
+
+        margin = CELL_SIZE * 4
+        view_x1 = self._h_adjustment.get_value() - margin
+        view_y1 = self._v_adjustment.get_value() - margin
+        view_x2 = view_x1 + page_w + 2 * margin
+        view_y2 = view_y1 + page_h + 2 * margin
+
+        for panel_id, widget in self.panel_widgets.items():
+            if page_w <= 0 or page_h <= 0:
+                # Not allocated yet, so the viewport is unknown
+                visible = True
+            else:
+                grid_x, grid_y = self.panel_positions.get(panel_id, (0, 0))
+                width_units, height_units = self.panel_sizes.get(panel_id, (1, 1))
+                x1, y1 = grid_x * CELL_SIZE, grid_y * CELL_SIZE
+                x2, y2 = x1 + width_units * CELL_SIZE, y1 + height_units * CELL_SIZE
+                visible = x1 < view_x2 and x2 > view_x1 and y1 < view_y2 and y2 > view_y1
+            if widget.get_child_visible() != visible:
+                widget.set_child_visible(visible)
 
     def create_panel_widget(self, config_dict):
         type_id = config_dict.get('type')
@@ -154,8 +191,14 @@ class GridLayoutManager(Gtk.Fixed):
                 disp_key = source_info['displayers'][0] if source_info['displayers'] else None
             
             if disp_key and disp_key in self.AVAILABLE_DISPLAYERS:
-                SourceClass = source_info['class']
-                DisplayerClass = self.AVAILABLE_DISPLAYERS[disp_key]['class']
+                # Panels can be built before the background load has dropped
+                # entries whose module fails to import, so skip those here.
+                try:
+                    SourceClass = resolve_class(source_info)
+                    DisplayerClass = resolve_class(self.AVAILABLE_DISPLAYERS[disp_key])
+                except (ImportError, AttributeError) as e:
+                    print(f"Warning: Could not create panel of type '{type_id}' with displayer '{disp_key}': {e}")
+                    return None
                 
                 source = SourceClass(config=config_dict)
                 displayer = DisplayerClass(panel_ref=None, config=config_dict)
@@ -170,7 +213,7 @@ class GridLayoutManager(Gtk.Fixed):
         print(f"Warning: Could not create panel. Unknown type_id: {type_id}")
         return None
 
-    def create_and_add_panel_from_config(self, config_dict):
+    def create_and_add_panel_from_config(self, config_dict, update_layout=True):
         panel_id = config_manager.add_panel_config(config_dict['type'], config_dict)
         full_config = dict(config_manager.config.items(panel_id))
         
@@ -181,16 +224,38 @@ class GridLayoutManager(Gtk.Fixed):
 
         new_widget = self.create_panel_widget(full_config)
         if new_widget:
-            self.add_panel(new_widget, full_config)
-            config_manager.save()
+            self.add_panel(new_widget, full_config, update_layout=update_layout)
+            config_manager.mark_dirty()
+
+    def create_and_add_panels_bulk(self, config_dicts):
+        """
+        Creates and adds several panels, resizing the container and restacking
+        the children once at the end instead of after every panel.
+        """
+        self.freeze_notify()
+        try:
+            for config_dict in config_dicts:
+                self.create_and_add_panel_from_config(config_dict, update_layout=False)
+        finally:
+            self._finish_bulk_add()
 
     def load_panels_from_config(self):
-        for type_id, cfg in config_manager.get_all_panel_configs():
-            panel = self.create_panel_widget(cfg)
-            if panel: 
-                self.add_panel(panel, cfg)
+        self.freeze_notify()
+        try:
+            for type_id, cfg in config_manager.get_all_panel_configs():
+                panel = self.create_panel_widget(cfg)
+                if panel: 
+                    self.add_panel(panel, cfg, update_layout=False)
+        finally:
+            self._finish_bulk_add()
         GLib.idle_add(self.check_and_update_scrolling_state)
 
+    def _finish_bulk_add(self):
+        self._recalculate_container_size()
+        self._sort_and_reorder_panels()
+        self.thaw_notify()
+        self.queue_allocate()
+
     def clear_all_panels(self):
         for panel_id in list(self.panel_widgets.keys()):
             self.remove_panel_widget_by_id(panel_id)
@@ -455,6 +520,7 @@ class GridLayoutManager(Gtk.Fixed):
                 panel_widget.set_selected_visual_indicator(panel_id in self.selected_panel_ids)
 
     def _load_and_apply_grid_config(self, config_data=None):
+        config_manager.invalidate_grid_style()
         style_context = self.get_style_context()
         if self._grid_background_css_provider:
             style_context.remove_provider(self._grid_background_css_provider)
@@ -646,7 +712,7 @@ class GridLayoutManager(Gtk.Fixed):
         self._layout_config_dialog = None
         self.check_and_update_scrolling_state()
 
-    def add_panel(self, widget, config):
+    def add_panel(self, widget, config, update_layout=True):
         panel_id = config["id"]
         width_units, height_units = int(config.get("width", 2)), int(config.get("height", 2))
         grid_x, grid_y = int(config.get("grid_x", 0)), int(config.get("grid_y", 0))
@@ -669,15 +735,24 @@ class GridLayoutManager(Gtk.Fixed):
         panel_drag_controller.connect("drag-end", self.on_drag_end, widget, panel_id)
         widget.add_controller(panel_drag_controller)
         
-        self._recalculate_container_size()
         widget.apply_panel_frame_style()
-        self._sort_and_reorder_panels()
+        # Bulk callers update the container size and stacking order once at the end
+        if update_layout:
+            self._recalculate_container_size()
+            self._sort_and_reorder_panels()
 
-    def handle_panel_dimension_update(self, panel_id, new_width_units, new_height_units):
+    def handle_panel_dimension_update(self, panel_id, new_width_units, new_height_units, update_layout=True):
         if panel_id not in self.panel_widgets: return
         self.panel_sizes[panel_id] = (new_width_units, new_height_units)
         widget = self.panel_widgets[panel_id]
         widget.set_size_request(new_width_units * CELL_SIZE, new_height_units * CELL_SIZE)
+        if update_layout:
+            self._recalculate_container_size()
+
+    def handle_panel_dimension_updates(self, updates):
+        """Applies several (panel_id, width_units, height_units) updates with one relayout."""
+        for panel_id, width_units, height_units in updates:
+            self.handle_panel_dimension_update(panel_id, width_units, height_units, update_layout=False)
         self._recalculate_container_size()
         
     def _find_first_available_spot(self, w_units, h_units, exclude_id=None):
@@ -715,6 +790,7 @@ class GridLayoutManager(Gtk.Fixed):
         required_width = bbox['width'] + CELL_SIZE
         required_height = bbox['height'] + CELL_SIZE
         self.set_size_request(required_width, required_height)
+        self._update_panel_visibility()
         GLib.idle_add(self.check_and_update_scrolling_state)
     
     def remove_panel_widget_by_id(self, panel_id_to_remove):
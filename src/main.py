@@ -5,65 +5,87 @@ import signal
 import uuid 
 import importlib
 import threading
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 
 APP_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
+# Prefer the NGL renderer, which handles many custom-drawn panels in a
+# scrolled grid more smoothly. Must be set before Gtk is loaded; an explicit
+# GSK_RENDERER in the environment (e.g. "cairo" on old Mesa) still wins.
+os.environ.setdefault("GSK_RENDERER", "ngl")
+
 import gi
 gi.require_version("Gtk", "4.0")
-gi.require_version('GdkPixbuf', '2.0')
 # Import Gdk for monitor information
-from gi.repository import Gtk, Gio, GLib, Gdk, GdkPixbuf
+from gi.repository import Gtk, Gio, GLib, Gdk
 
 # --- Centralized Module & Data Loading ---
+# Importing the registry only publishes metadata. Source and displayer modules
+# are imported in the background once the application has started, or on
+# first use via module_registry.resolve_class().
 import module_registry
-module_registry.discover_and_load_modules()
-from module_registry import AVAILABLE_DATA_SOURCES, AVAILABLE_DISPLAYERS, ALL_SOURCE_CLASSES
+from module_registry import AVAILABLE_DATA_SOURCES, AVAILABLE_DISPLAYERS
 # ----------------------------------------- 
 
 from config_manager import config_manager
 from grid_layout_manager import GridLayoutManager, CELL_SIZE
 from utils import show_confirmation_dialog
 from ui_helpers import CustomDialog
-from panel_builder_dialog import PanelBuilderDialog
-from data_panel import DataPanel
 from gpu_managers import gpu_manager
 from update_manager import update_manager 
-
-# --- Import sensor data sources for background discovery ---
-from data_sources.cpu_source import CPUDataSource
-from data_sources.fan_speed import FanSpeedDataSource
-from data_sources.system_temp import SystemTempDataSource
+import sensor_cache
 from sensor_cache import SENSOR_CACHE
 
 # --- Import config_dialog to pre-load the font dialog ---
 import config_dialog
 
-DEFAULT_PANEL_LAYOUT = [
+# Half a grid cell, used to round window sizes to the nearest cell multiple
+_HALF_CELL = CELL_SIZE >> 1
+
+# Read-only; on_reset_panels() makes a fresh mutable dict from each entry.
+DEFAULT_PANEL_LAYOUT = tuple(MappingProxyType(d) for d in [
     {'type': 'cpu', 'displayer_type': 'arc_gauge', 'width': '16', 'height': '16', 'grid_x': '0', 'grid_y': '0', 'title_text': 'CPU Usage', 'cpu_metric_to_display': 'usage'},
     {'type': 'cpu', 'displayer_type': 'arc_gauge', 'width': '16', 'height': '16', 'grid_x': '16', 'grid_y': '0', 'title_text': 'CPU Temperature', 'cpu_metric_to_display': 'temperature'},
     {'type': 'analog_clock', 'displayer_type': 'analog_clock', 'width': '16', 'height': '16', 'grid_x': '32', 'grid_y': '0', 'title_text': 'Clock'},
     {'type': 'memory_usage', 'displayer_type': 'arc_gauge', 'width': '16', 'height': '16', 'grid_x': '0', 'grid_y': '16', 'title_text': 'RAM'},
     {'type': 'disk_usage', 'displayer_type': 'arc_gauge', 'width': '16', 'height': '16', 'grid_x': '16', 'grid_y': '16', 'title_text': 'Disk'},
     {'type': 'gpu', 'displayer_type': 'level_bar', 'width': '16', 'height': '16', 'grid_x': '32', 'grid_y': '16', 'title_text': 'GPU TEMP', 'gpu_metric_to_display': 'temperature'},
-]
+])
 
 class MainWindow(Gtk.ApplicationWindow):
-    def __init__(self, app, sensors_ready_event=None, cli_options=None):
+    def __init__(self, app, sensors_ready_event=None, cli_options=None, modules_ready_event=None):
         super().__init__(title="gSens System Monitor", application=app)
+        # All instance attributes are created up front, in one place, so the
+        # instance dict is populated once instead of growing throughout __init__.
         self.app = app
         self.sensors_ready_event = sensors_ready_event
+        self.modules_ready_event = modules_ready_event
         # Store command-line options
         self.cli_options = cli_options or {}
 
-        # --- NEW: Add a flag to prevent resize signal recursion ---
-        self._is_snapping = False
-
         # Use the centrally loaded module data
         self.AVAILABLE_DATA_SOURCES = AVAILABLE_DATA_SOURCES
         self.AVAILABLE_DISPLAYERS = AVAILABLE_DISPLAYERS
-        self.ALL_SOURCE_CLASSES = ALL_SOURCE_CLASSES
-        
+
+        # Widgets and actions, created below
+        self.grid_manager = None
+        self.scrolled_window = None
+        self.add_panel_button = None
+        self.window_actions = {}
+
+        # Guards against opening the quit confirmation twice
+        self._close_dialog_open = False
+
+        # Pending timeout that snaps the window once resizing has settled
+        self._snap_timer_id = None
+
+        # The monitor list model is live; only its cached size needs refreshing on hot-plug
+        self._monitors = self.get_display().get_monitors()
+        self._monitor_count = self._monitors.get_n_items()
+        self._monitors.connect("items-changed", self._on_monitors_changed)
+
         # --- Apply borderless setting immediately on startup ---
         if config_manager.config.has_section("GridLayout"):
             grid_config = config_manager.config["GridLayout"]
@@ -74,8 +96,7 @@ class MainWindow(Gtk.ApplicationWindow):
         
         self.grid_manager = GridLayoutManager(
             available_sources=self.AVAILABLE_DATA_SOURCES,
-            available_displayers=self.AVAILABLE_DISPLAYERS,
-            all_source_classes=self.ALL_SOURCE_CLASSES
+            available_displayers=self.AVAILABLE_DISPLAYERS
         )
         
         self.scrolled_window = Gtk.ScrolledWindow(child=self.grid_manager)
@@ -90,15 +111,17 @@ class MainWindow(Gtk.ApplicationWindow):
         
         self.build_header_bar_and_actions()
         
-        if hasattr(self.grid_manager, '_load_and_apply_grid_config'):
-            self.grid_manager._load_and_apply_grid_config()
+        self.grid_manager._load_and_apply_grid_config()
             
         self.connect("notify::fullscreened", self._on_fullscreen_changed)
         # --- NEW: Connect to size change signals for snapping ---
         self.connect("notify::default-width", self._on_window_resize_snap)
         self.connect("notify::default-height", self._on_window_resize_snap)
         self._setup_key_press_controller()
-        GLib.timeout_add(100, self._check_sensors_ready)
+        # Sensors restored from the previous run are ready already, so panels
+        # are built now rather than after the first poll interval.
+        if self._check_sensors_ready() == GLib.SOURCE_CONTINUE:
+            GLib.timeout_add(100, self._check_sensors_ready)
         
         # Apply fullscreen settings based on CLI args and config
         GLib.idle_add(self._apply_startup_fullscreen_settings)
@@ -112,11 +135,16 @@ class MainWindow(Gtk.ApplicationWindow):
 
     def _on_sensors_ready(self):
         """Called when the background sensor discovery is complete."""
-        # Now that sensors are discovered, we can safely load the panels.
+        # Now that sensors are discovered, we can safely load the panels. Their
+        # classes are resolved on demand, so this does not wait for the
+        # background module load.
         self.grid_manager.load_panels_from_config()
-        self.add_panel_button.set_sensitive(True)
         return GLib.SOURCE_REMOVE
 
+    def on_modules_loaded(self):
+        """Called once the background module load has filled the Add Panel lists."""
+        self.add_panel_button.set_sensitive(True)
+
     def _setup_key_press_controller(self):
         key_controller = Gtk.EventControllerKey.new()
         key_controller.connect("key-pressed", self._on_key_pressed)
@@ -129,45 +157,57 @@ class MainWindow(Gtk.ApplicationWindow):
                 return True
         return False
 
-    # --- NEW: Snapping logic ---
-    def _reset_snapping_flag(self):
-        """Resets the recursion guard flag."""
-        self._is_snapping = False
-        return GLib.SOURCE_REMOVE
-
+    # --- Snapping logic ---
     def _on_window_resize_snap(self, *args):
-        """Callback to snap the window size to the nearest grid cell multiple."""
-        if self._is_snapping or self.is_fullscreen():
+        """
+        Called for every size change while the user resizes the window.
+        GTK4 has no reliable resize-end signal (the drag is often owned by the
+        compositor), so the snap is deferred until no size change has been
+        seen for a short while and then applied exactly once. The notification
+        caused by the snap itself re-arms the timer, which then finds the size
+        already on the grid.
+        """
+        if self._snap_timer_id:
+            GLib.source_remove(self._snap_timer_id)
+            self._snap_timer_id = None
+
+        if self.is_fullscreen():
             return
 
-        self._is_snapping = True
-        
+        # The allocation still holds the previous size at this point, so the
+        # on-grid check is left to _snap_window_size once the resize settles.
+        self._snap_timer_id = GLib.timeout_add(250, self._snap_window_size)
+
+    def _snap_window_size(self):
+        """Snaps the window size to the nearest grid cell multiple."""
+        self._snap_timer_id = None
+        if self.is_fullscreen():
+            return GLib.SOURCE_REMOVE
+
         current_width = self.get_width()
         current_height = self.get_height()
         
-        # Calculate the new size rounded to the nearest CELL_SIZE
-        snapped_width = round(current_width / CELL_SIZE) * CELL_SIZE
-        snapped_height = round(current_height / CELL_SIZE) * CELL_SIZE
+        # Calculate the new size rounded (half up) to the nearest CELL_SIZE
+        snapped_width = ((current_width + _HALF_CELL) // CELL_SIZE) * CELL_SIZE
+        snapped_height = ((current_height + _HALF_CELL) // CELL_SIZE) * CELL_SIZE
         
-        # Only resize if the size has actually changed to avoid unnecessary events
-        if current_width != snapped_width or current_height != snapped_height:
+        # Only resize if the size has actually changed; ignore 1px jitter from fractional scaling
+        if abs(current_width - snapped_width) > 1 or abs(current_height - snapped_height) > 1:
             # --- FIX: Use set_default_size for GTK4 ---
             self.set_default_size(snapped_width, snapped_height)
+        return GLib.SOURCE_REMOVE
 
-        # Reset the flag after the current GTK main loop iteration is done
-        GLib.idle_add(self._reset_snapping_flag)
+    def _on_monitors_changed(self, monitors, position, removed, added):
+        self._monitor_count = monitors.get_n_items()
 
     def _fullscreen_on_monitor_index(self, monitor_index):
         """Helper function to fullscreen on a specific monitor index."""
         try:
-            display = self.get_display()
-            monitors = display.get_monitors()
-            num_monitors = monitors.get_n_items()
-            if 0 <= monitor_index < num_monitors:
-                monitor = monitors.get_item(monitor_index)
+            monitor = self._monitors.get_item(monitor_index) if 0 <= monitor_index < self._monitor_count else None
+            if monitor:
                 self.fullscreen_on_monitor(monitor)
             else:
-                print(f"Warning: Monitor index {monitor_index} is out of range (0-{num_monitors-1}). Defaulting to primary.")
+                print(f"Warning: Monitor index {monitor_index} is out of range (0-{self._monitor_count-1}). Defaulting to primary.")
                 self.fullscreen()
         except Exception as e:
             print(f"Error applying fullscreen to monitor {monitor_index}: {e}. Defaulting.")
@@ -198,27 +238,18 @@ class MainWindow(Gtk.ApplicationWindow):
             return GLib.SOURCE_REMOVE
 
         # 4. If no CLI args, use config file settings
-        grid_config = config_manager.config["GridLayout"] if config_manager.config.has_section("GridLayout") else {}
-        if grid_config.get("launch_fullscreen", "False").lower() == 'true':
-            try:
-                monitor_index = int(grid_config.get("fullscreen_display_index", -1))
-                if monitor_index == -1:
-                    self.fullscreen()
-                else:
-                    self._fullscreen_on_monitor_index(monitor_index)
-            except (ValueError, TypeError) as e:
-                print(f"Error applying config fullscreen setting: {e}. Defaulting.")
+        grid_layout = config_manager.grid_layout
+        if grid_layout['launch_fullscreen']:
+            monitor_index = grid_layout['fullscreen_display_index']
+            if monitor_index == -1:
                 self.fullscreen()
+            else:
+                self._fullscreen_on_monitor_index(monitor_index)
         
         return GLib.SOURCE_REMOVE
 
     def _on_fullscreen_changed(self, window, pspec):
-        is_fullscreen = self.is_fullscreen()
-        
         if self.grid_manager:
-            if hasattr(self.grid_manager, '_update_fullscreen_menu_item_label'):
-                self.grid_manager._update_fullscreen_menu_item_label(self)
-            
             # --- MODIFIED: Delegate scrolling logic to the central method ---
             self.grid_manager.check_and_update_scrolling_state()
 
@@ -236,17 +267,18 @@ class MainWindow(Gtk.ApplicationWindow):
 
     def on_add_panel_activate(self, *args):
         """Opens the new Panel Builder dialog."""
-        sorted_sources = sorted(list(self.AVAILABLE_DATA_SOURCES.values()), key=lambda x: x['name'])
-        sorted_displayers = sorted(list(self.AVAILABLE_DISPLAYERS.values()), key=lambda x: x['name'])
-        
-        PanelBuilderDialog(self, self.grid_manager, sorted_sources, sorted_displayers)
+        # Imported on first use to keep it off the startup path
+        from panel_builder_dialog import PanelBuilderDialog
+        # Read through the module so the lists rebuilt by register_modules() are used
+        PanelBuilderDialog(self, self.grid_manager, module_registry.SORTED_DATA_SOURCES, module_registry.SORTED_DISPLAYERS)
 
     def build_header_bar_and_actions(self):
         header = Gtk.HeaderBar(); self.set_titlebar(header)
         
         self.add_panel_button = Gtk.Button(icon_name="list-add-symbolic", tooltip_text="Add Panel")
         self.add_panel_button.set_action_name("win.add_panel")
-        self.add_panel_button.set_sensitive(False) # Initially disabled while scanning
+        # Disabled until the background module load has filled the Add Panel lists
+        self.add_panel_button.set_sensitive(self.modules_ready_event is None or self.modules_ready_event.is_set())
         header.pack_start(self.add_panel_button)
 
         menu_btn = Gtk.MenuButton(icon_name="open-menu-symbolic", tooltip_text="Menu")
@@ -261,37 +293,36 @@ class MainWindow(Gtk.ApplicationWindow):
         menu_btn.set_menu_model(main_menu)
         header.pack_end(menu_btn)
 
+        def save_layout_now_cb(action, parameter):
+            self.save_window_dimensions()
+            config_manager.save(immediate=True) # Explicit user action should save immediately
+            print("Layout saved.")
+
         actions = {"add_panel": self.on_add_panel_activate,
                    "save_layout_as": self.on_save_layout_as, 
                    "load_layout_from": self.on_load_layout_from, 
                    "reset_panels": self.on_reset_panels, 
                    "clear_panels": self.on_clear_panels, 
-                   "toggle_fullscreen": self.toggle_fullscreen_mode}
+                   "toggle_fullscreen": self.toggle_fullscreen_mode,
+                   "save_layout_now": save_layout_now_cb}
+        # Keep the created actions so their enabled state can be toggled later
+        # without going through lookup_action().
         for name, cb in actions.items():
             action = Gio.SimpleAction.new(name, None)
             action.connect("activate", cb)
             self.add_action(action)
-
-        def save_layout_now_cb(action, parameter):
-            self.save_window_dimensions()
-            config_manager.save(immediate=True) # Explicit user action should save immediately
-            print("Layout saved.")
-        
-        save_now_action = Gio.SimpleAction.new("save_layout_now", None)
-        save_now_action.connect("activate", save_layout_now_cb)
-        self.add_action(save_now_action)
+            self.window_actions[name] = action
 
     def on_clear_panels(self, *args):
         if show_confirmation_dialog(self, "Clear All?", "This will delete all panels.", "This action cannot be undone.", "_Delete", "destructive-action") == Gtk.ResponseType.OK:
             self.grid_manager.clear_all_panels()
-            config_manager.save()
+            config_manager.mark_dirty()
 
     def on_reset_panels(self, *args):
         if show_confirmation_dialog(self, "Reset Layout?", "This will replace the current layout with the default one.", "This action cannot be undone.", "_Reset", "destructive-action") == Gtk.ResponseType.OK:
             self.grid_manager.clear_all_panels()
-            for cfg_template in DEFAULT_PANEL_LAYOUT:
-                self.grid_manager.create_and_add_panel_from_config(cfg_template.copy())
-            config_manager.save()
+            self.grid_manager.create_and_add_panels_bulk([dict(cfg) for cfg in DEFAULT_PANEL_LAYOUT])
+            config_manager.mark_dirty()
 
     def on_save_layout_as(self, *args):
         chooser = Gtk.FileChooserNative.new("Save Layout", self, Gtk.FileChooserAction.SAVE, "_Save", "_Cancel")
@@ -317,12 +348,21 @@ class MainWindow(Gtk.ApplicationWindow):
         chooser.show()
 
     def do_close_request(self):
+        if self._close_dialog_open:
+            return True
+        self._close_dialog_open = True
+
         dialog = CustomDialog(self, "Quit Application", "Save current layout before quitting?", icon_name="dialog-question-symbolic")
         dialog.add_styled_button("_Cancel", Gtk.ResponseType.CANCEL)
         dialog.add_styled_button("_Quit Without Saving", Gtk.ResponseType.NO, "destructive-action")
         dialog.add_styled_button("_Save and Quit", Gtk.ResponseType.YES, "suggested-action", is_default=True)
-        response = dialog.run()
+        dialog.run_async(self._on_close_dialog_response)
         
+        # Always block the default close; the response handler quits if needed.
+        return True
+
+    def _on_close_dialog_response(self, response):
+        self._close_dialog_open = False
         if response == Gtk.ResponseType.YES:
             self.save_window_dimensions()
             # Force immediate save on exit to bypass debounce timer
@@ -330,8 +370,9 @@ class MainWindow(Gtk.ApplicationWindow):
             self.app.quit()
         elif response == Gtk.ResponseType.NO:
             self.app.quit()
-            
-        return True
+
+RESOURCE_BASE_PATH = "/com/example/gtk-system-monitor"
+RESOURCE_BUNDLE = os.path.join(APP_DIR, "gsens.gresource")
 
 class SystemMonitorApp(Gtk.Application):
     def __init__(self, **kwargs):
@@ -339,8 +380,10 @@ class SystemMonitorApp(Gtk.Application):
                          # Add HANDLES_COMMAND_LINE flag
                          flags=Gio.ApplicationFlags.HANDLES_COMMAND_LINE | Gio.ApplicationFlags.NON_UNIQUE, 
                          **kwargs)
+        self._register_resources()
         self.window = None
         self.sensors_ready_event = threading.Event()
+        self.modules_ready_event = threading.Event()
         self.command_line_options = {} # To store parsed options
         self._is_background = False
         
@@ -383,7 +426,8 @@ class SystemMonitorApp(Gtk.Application):
                 print("Initializing gSens in background mode...")
                 self.window = MainWindow(self, 
                                          sensors_ready_event=self.sensors_ready_event,
-                                         cli_options=self.command_line_options)
+                                         cli_options=self.command_line_options,
+                                         modules_ready_event=self.modules_ready_event)
                 # Hold the application so it doesn't exit when no windows are shown
                 self.hold()
                 self._is_background = True
@@ -392,7 +436,8 @@ class SystemMonitorApp(Gtk.Application):
             if not self.window:
                 self.window = MainWindow(self, 
                                          sensors_ready_event=self.sensors_ready_event,
-                                         cli_options=self.command_line_options)
+                                         cli_options=self.command_line_options,
+                                         modules_ready_event=self.modules_ready_event)
             
             if self._is_background:
                 print("Background instance summoned.")
@@ -404,6 +449,19 @@ class SystemMonitorApp(Gtk.Application):
         # Clear options after passing them to the window logic
         self.command_line_options = {}
 
+    def _register_resources(self):
+        """
+        Registers the compiled asset bundle, if it has been built with
+        `glib-compile-resources gsens.gresource.xml`. GTK adds the icons/
+        folder under the resource base path to the icon theme at startup,
+        so the window icon is then resolved from memory by name.
+        """
+        try:
+            Gio.Resource.load(RESOURCE_BUNDLE)._register()
+        except GLib.Error:
+            return
+        self.set_resource_base_path(RESOURCE_BASE_PATH)
+
     def do_command_line(self, command_line):
         """Handles command-line argument processing."""
         options = command_line.get_options_dict()
@@ -459,7 +517,21 @@ class SystemMonitorApp(Gtk.Application):
 
     def do_startup(self):
         Gtk.Application.do_startup(self)
-        
+
+        # Sensors found on a previous run let panels be built right away; the
+        # background discovery still refreshes them.
+        if sensor_cache.load_persisted():
+            print("Loaded sensors from the previous run.")
+            self.sensors_ready_event.set()
+
+        # Start sensor discovery first so its sysfs walks overlap with the icon
+        # lookup and GPU initialization below. It only writes SENSOR_CACHE,
+        # which is not read until panels are created.
+        sensor_discovery_thread = threading.Thread(target=self._discover_sensors_background, 
+                                                   args=(self.sensors_ready_event,), 
+                                                   daemon=True)
+        sensor_discovery_thread.start()
+
         try:
             icon_name = self.get_application_id()
             if icon_name:
@@ -470,10 +542,8 @@ class SystemMonitorApp(Gtk.Application):
         gpu_manager.init()
         update_manager.start()
         
-        sensor_discovery_thread = threading.Thread(target=self._discover_sensors_background, 
-                                                   args=(self.sensors_ready_event,), 
-                                                   daemon=True)
-        sensor_discovery_thread.start()
+        module_loader_thread = threading.Thread(target=self._load_modules_background, daemon=True)
+        module_loader_thread.start()
 
         # --- NEW: Pre-load the font dialog in the background ---
         # Use our new thread-safe strategy
@@ -482,8 +552,10 @@ class SystemMonitorApp(Gtk.Application):
         font_cache_thread.start()
         # --- END NEW ---
         
-        for sig in [signal.SIGINT, signal.SIGTERM]:
-            GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, sig, self.on_signal, sig)
+        # SIGINT is already handled by PyGObject's Application.run(), which
+        # quits the application through the normal shutdown path. SIGTERM is
+        # not, so it still needs its own handler to reach do_shutdown.
+        GLib.unix_signal_add(GLib.PRIORITY_DEFAULT, signal.SIGTERM, self.on_signal, signal.SIGTERM)
 
         action = Gio.SimpleAction.new("quit", None)
         action.connect("activate", self.on_quit)
@@ -519,36 +591,82 @@ class SystemMonitorApp(Gtk.Application):
              print(f"Error creating global font dialog: {e}")
         return GLib.SOURCE_REMOVE
 
+    def _load_modules_background(self):
+        """
+        Worker function to import the remaining data source and displayer
+        modules. The registry itself is only updated on the main thread.
+        """
+        try:
+            loaded_classes = module_registry.load_all_modules()
+        except Exception as e:
+            # Keep the published metadata; resolve_class() still imports lazily
+            print(f"Error during background module loading: {e}")
+            loaded_classes = None
+        GLib.idle_add(self._on_modules_loaded, loaded_classes)
+
+    def _on_modules_loaded(self, loaded_classes):
+        """
+        Publishes the background-loaded modules on the main thread. This only
+        warms the registry for the Add Panel lists; panels resolve their own
+        classes on demand.
+        """
+        if loaded_classes is not None:
+            module_registry.register_modules(*loaded_classes)
+        self.modules_ready_event.set()
+        if self.window:
+            self.window.on_modules_loaded()
+        return GLib.SOURCE_REMOVE
+
     def _discover_sensors_background(self, ready_event):
         """
         Worker function to discover all hardware sensors in the background.
         """
         print("Starting background sensor discovery...")
+        # On Linux nice() applies to the calling thread only, and the executor
+        # threads below inherit it, so the sysfs burst yields to the main loop.
         try:
-            SENSOR_CACHE['cpu_temp'] = CPUDataSource._discover_cpu_temp_sensors_statically()
-            print(f"Background discovery: Found {len(SENSOR_CACHE.get('cpu_temp', []))} CPU temperature sensors.")
-            
-            SENSOR_CACHE['fan_speed'] = FanSpeedDataSource._discover_fans_statically()
-            print(f"Background discovery: Found {len(SENSOR_CACHE.get('fan_speed', []))} fans.")
-
-            SENSOR_CACHE['system_temp'] = SystemTempDataSource._discover_temp_sensors_statically()
-            print(f"Background discovery: Found {len(SENSOR_CACHE.get('system_temp', []))} general system temperature sensors.")
+            os.nice(10)
+        except OSError:
+            pass
+        try:
+            # Imported here so the module loading happens on the worker thread
+            from data_sources.cpu_source import CPUDataSource
+            from data_sources.fan_speed import FanSpeedDataSource
+            from data_sources.system_temp import SystemTempDataSource
+
+            discoverers = {
+                'cpu_temp': (CPUDataSource._discover_cpu_temp_sensors_statically, "CPU temperature sensors"),
+                'fan_speed': (FanSpeedDataSource._discover_fans_statically, "fans"),
+                'system_temp': (SystemTempDataSource._discover_temp_sensors_statically, "general system temperature sensors"),
+            }
+            # The discoverers are independent sysfs walks, so run them concurrently
+            with ThreadPoolExecutor(max_workers=len(discoverers), thread_name_prefix='gSens_SensorDiscovery_') as executor:
+                futures = {key: executor.submit(func) for key, (func, _) in discoverers.items()}
+                for key, future in futures.items():
+                    try:
+                        SENSOR_CACHE[key] = future.result()
+                        print(f"Background discovery: Found {len(SENSOR_CACHE.get(key, []))} {discoverers[key][1]}.")
+                    except Exception as e:
+                        print(f"Error discovering {discoverers[key][1]}: {e}")
 
         except Exception as e:
             print(f"Error during background sensor discovery: {e}")
         finally:
             print("Background sensor discovery finished.")
+            sensor_cache.persist()
             ready_event.set()
 
     def do_shutdown(self):
         update_manager.stop()
         gpu_manager.shutdown()
+        config_manager.flush_pending()
         Gtk.Application.do_shutdown(self)
 
     def on_quit(self, *args):
         if self.window and self.window.is_visible():
-            if not self.window.do_close_request():
-                return
+            # The confirmation dialog quits the application itself if confirmed.
+            self.window.do_close_request()
+            return
         self.quit()
 
     def on_signal(self, signum):
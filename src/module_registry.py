@@ -1,90 +1,145 @@
 # /module_registry.py
-import os
+import sys
 import importlib
 
-APP_DIR = os.path.dirname(os.path.abspath(__file__))
-
-# Base classes for dynamic loading
-from data_source import DataSource
-from data_displayer import DataDisplayer
-
 # Dictionaries to hold the dynamically loaded classes and their metadata
-ALL_SOURCE_CLASSES = {}
-ALL_DISPLAYER_CLASSES = {}
 AVAILABLE_DATA_SOURCES = {}
 AVAILABLE_DISPLAYERS = {}
+# Module paths that failed to import; later lookups fail fast instead of
+# walking the import finders again
+_FAILED_IMPORTS = set()
+# Registry entries in display-name order, rebuilt whenever the registry changes
+SORTED_DATA_SOURCES = ()
+SORTED_DISPLAYERS = ()
 
-def _load_modules_from_directory(directory, base_class, target_dict):
-    """Dynamically loads modules and populates a target dictionary mapping ClassName to ClassObject."""
-    dir_path = os.path.join(APP_DIR, directory)
-    if not os.path.isdir(dir_path):
-        return
-        
-    for filename in os.listdir(dir_path):
-        if filename.endswith(".py") and not filename.startswith("__"):
-            module_name = filename[:-3]
-            module_path = f"{directory}.{module_name}"
-            try:
-                module = importlib.import_module(module_path)
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if isinstance(attr, type) and issubclass(attr, base_class) and attr is not base_class:
-                        target_dict[attr_name] = attr
-            except ImportError as e:
-                print(f"Error importing module {module_path}: {e}")
+def _import_class(meta):
+    """Imports the module declared in a metadata entry and returns its class."""
+    module_path = meta['module']
+    module = sys.modules.get(module_path)
+    if module is None:
+        if module_path in _FAILED_IMPORTS:
+            raise ImportError(f"{module_path} failed to import earlier")
+        try:
+            module = importlib.import_module(module_path)
+        except ImportError:
+            _FAILED_IMPORTS.add(module_path)
+            raise
+    return getattr(module, meta['class_name'])
 
-def discover_and_load_modules():
+def _load_classes(metadata, keys=None):
     """
-    Discovers all source and displayer modules, loads them, and populates
-    the global dictionaries with their classes and metadata.
-    This should be called once at application startup.
+    Imports the classes declared in metadata and returns a ClassName -> ClassObject
+    dictionary. If keys is given, only those entries are imported.
     """
-    _load_modules_from_directory('data_sources', DataSource, ALL_SOURCE_CLASSES)
-    _load_modules_from_directory('data_displayers', DataDisplayer, ALL_DISPLAYER_CLASSES)
+    classes = {}
+    for meta in metadata:
+        if keys is not None and meta['key'] not in keys:
+            continue
+        try:
+            classes[meta['class_name']] = _import_class(meta)
+        except (ImportError, AttributeError) as e:
+            print(f"Error importing {meta['class_name']} from {meta['module']}: {e}")
+    return classes
 
-    # --- Added 'cpu_multicore' to displayers list for 'cpu' source ---
-    SOURCE_METADATA = sorted([
-        {'key': 'analog_clock', 'class_name': 'AnalogClockDataSource', 'name': 'Clock', "displayers": ["analog_clock", "text"], "default_size": (16, 16)},
-        {'key': 'combo', 'class_name': 'ComboDataSource', 'name': 'Combo Panel', "displayers": ["arc_combo", "level_bar_combo", "lcars_combo", "dashboard_combo"], "default_size": (24, 20)},
-        {'key': 'cpu', 'class_name': 'CPUDataSource', 'name': 'CPU Monitor', "displayers": ["text", "graph", "bar", "arc_gauge", "indicator", "level_bar", "speedometer", "cpu_multicore"], "default_size": (16, 16)},
-        {'key': 'disk_usage', 'class_name': 'DiskUsageDataSource', 'name': 'Disk Usage', "displayers": ["text", "bar", "arc_gauge", "indicator", "level_bar", "speedometer", "graph"], "default_size": (16, 16)},
-        {'key': 'fan_speed', 'class_name': 'FanSpeedDataSource', 'name': 'Fan Speed', "displayers": ["text", "graph", "bar", "arc_gauge", "indicator", "level_bar", "speedometer"], "default_size": (16, 16)},
-        {'key': 'gpu', 'class_name': 'GPUDataSource', 'name': 'GPU Monitor', "displayers": ["text", "graph", "bar", "arc_gauge", "indicator", "level_bar", "speedometer"], "default_size": (16, 16)},
-        {'key': 'memory_usage', 'class_name': 'MemoryUsageDataSource', 'name': 'Memory Usage', "displayers": ["text", "graph", "bar", "arc_gauge", "indicator", "level_bar", "speedometer"], "default_size": (16, 16)},
-        {'key': 'network', 'class_name': 'NetworkDataSource', 'name': 'Network Activity', "displayers": ["text", "graph", "level_bar", "arc_gauge", "speedometer", "bar", "indicator"], "default_size": (16, 10)},
-        {'key': 'processes', 'class_name': 'ProcessDataSource', 'name': 'Process Monitor', "displayers": ["text", "table"], "default_size": (24, 16)},
-        {'key': 'static', 'class_name': 'StaticDataSource', 'name': 'Static Content', "displayers": ["static"], "default_size": (16, 8)},
-        {'key': 'systemd', 'class_name': 'SystemdDataSource', 'name': 'Systemd Services', "displayers": ["text"], "default_size": (24, 8)},
-        {'key': 'system_temp', 'class_name': 'SystemTempDataSource', 'name': 'System Temperature', "displayers": ["graph", "text", "bar", "arc_gauge", "indicator", "level_bar", "speedometer"], "default_size": (16, 16)},
-    ], key=lambda x: x['name'])
+# --- Added 'cpu_multicore' to displayers list for 'cpu' source ---
+SOURCE_METADATA = sorted([
+    {'key': 'analog_clock', 'module': 'data_sources.analog_clock', 'class_name': 'AnalogClockDataSource', 'name': 'Clock', "displayers": ["analog_clock", "text"], "default_size": (16, 16)},
+    {'key': 'combo', 'module': 'data_sources.combo_source', 'class_name': 'ComboDataSource', 'name': 'Combo Panel', "displayers": ["arc_combo", "level_bar_combo", "lcars_combo", "dashboard_combo"], "default_size": (24, 20)},
+    {'key': 'cpu', 'module': 'data_sources.cpu_source', 'class_name': 'CPUDataSource', 'name': 'CPU Monitor', "displayers": ["text", "graph", "bar", "arc_gauge", "indicator", "level_bar", "speedometer", "cpu_multicore"], "default_size": (16, 16)},
+    {'key': 'disk_usage', 'module': 'data_sources.disk_usage', 'class_name': 'DiskUsageDataSource', 'name': 'Disk Usage', "displayers": ["text", "bar", "arc_gauge", "indicator", "level_bar", "speedometer", "graph"], "default_size": (16, 16)},
+    {'key': 'fan_speed', 'module': 'data_sources.fan_speed', 'class_name': 'FanSpeedDataSource', 'name': 'Fan Speed', "displayers": ["text", "graph", "bar", "arc_gauge", "indicator", "level_bar", "speedometer"], "default_size": (16, 16)},
+    {'key': 'gpu', 'module': 'data_sources.gpu_source', 'class_name': 'GPUDataSource', 'name': 'GPU Monitor', "displayers": ["text", "graph", "bar", "arc_gauge", "indicator", "level_bar", "speedometer"], "default_size": (16, 16)},
+    {'key': 'memory_usage', 'module': 'data_sources.memory_usage', 'class_name': 'MemoryUsageDataSource', 'name': 'Memory Usage', "displayers": ["text", "graph", "bar", "arc_gauge", "indicator", "level_bar", "speedometer"], "default_size": (16, 16)},
+    {'key': 'network', 'module': 'data_sources.network_source', 'class_name': 'NetworkDataSource', 'name': 'Network Activity', "displayers": ["text", "graph", "level_bar", "arc_gauge", "speedometer", "bar", "indicator"], "default_size": (16, 10)},
+    {'key': 'processes', 'module': 'data_sources.process_source', 'class_name': 'ProcessDataSource', 'name': 'Process Monitor', "displayers": ["text", "table"], "default_size": (24, 16)},
+    {'key': 'static', 'module': 'data_sources.static_source', 'class_name': 'StaticDataSource', 'name': 'Static Content', "displayers": ["static"], "default_size": (16, 8)},
+    {'key': 'systemd', 'module': 'data_sources.systemd_source', 'class_name': 'SystemdDataSource', 'name': 'Systemd Services', "displayers": ["text"], "default_size": (24, 8)},
+    {'key': 'system_temp', 'module': 'data_sources.system_temp', 'class_name': 'SystemTempDataSource', 'name': 'System Temperature', "displayers": ["graph", "text", "bar", "arc_gauge", "indicator", "level_bar", "speedometer"], "default_size": (16, 16)},
+], key=lambda x: x['name'])
 
-    # --- Added 'cpu_multicore' entry ---
-    DISPLAYER_METADATA = sorted([
-        {'key': 'analog_clock', 'class_name': 'AnalogClockDisplayer', 'name': 'Analog Clock'},
-        {'key': 'arc_gauge', 'class_name': 'ArcGaugeDisplayer', 'name': 'Arc Gauge'},
-        {'key': 'bar', 'class_name': 'BarDisplayer', 'name': 'Bar Chart'},
-        {'key': 'arc_combo', 'class_name': 'ArcComboDisplayer', 'name': 'Combo (Arcs)'},
-        {'key': 'dashboard_combo', 'class_name': 'DashboardComboDisplayer', 'name': 'Combo (Dashboard)'},
-        {'key': 'level_bar_combo', 'class_name': 'LevelBarComboDisplayer', 'name': 'Combo (Level Bars)'},
-        {'key': 'lcars_combo', 'class_name': 'LCARSComboDisplayer', 'name': 'Combo (LCARS)'},
-        {'key': 'graph', 'class_name': 'GraphDisplayer', 'name': 'Graph'},
-        {'key': 'indicator', 'class_name': 'IndicatorDisplayer', 'name': 'Indicator'},
-        {'key': 'level_bar', 'class_name': 'LevelBarDisplayer', 'name': 'Level Bar'},
-        {'key': 'speedometer', 'class_name': 'SpeedometerDisplayer', 'name': 'Speedometer'},
-        {'key': 'static', 'class_name': 'StaticDisplayer', 'name': 'Static Image/Text'},
-        {'key': 'text', 'class_name': 'TextDisplayer', 'name': 'Text'},
-        {'key': 'table', 'class_name': 'TableDisplayer', 'name': 'Table'},
-        {'key': 'cpu_multicore', 'class_name': 'CpuMultiCoreDisplayer', 'name': 'Multi-Core Bars'},
-    ], key=lambda x: x['name'])
+# --- Added 'cpu_multicore' entry ---
+DISPLAYER_METADATA = sorted([
+    {'key': 'analog_clock', 'module': 'data_displayers.analog_clock', 'class_name': 'AnalogClockDisplayer', 'name': 'Analog Clock'},
+    {'key': 'arc_gauge', 'module': 'data_displayers.arc_gauge', 'class_name': 'ArcGaugeDisplayer', 'name': 'Arc Gauge'},
+    {'key': 'bar', 'module': 'data_displayers.bar', 'class_name': 'BarDisplayer', 'name': 'Bar Chart'},
+    {'key': 'arc_combo', 'module': 'data_displayers.arc_combo', 'class_name': 'ArcComboDisplayer', 'name': 'Combo (Arcs)'},
+    {'key': 'dashboard_combo', 'module': 'data_displayers.dashboard_combo', 'class_name': 'DashboardComboDisplayer', 'name': 'Combo (Dashboard)'},
+    {'key': 'level_bar_combo', 'module': 'data_displayers.level_bar_combo', 'class_name': 'LevelBarComboDisplayer', 'name': 'Combo (Level Bars)'},
+    {'key': 'lcars_combo', 'module': 'data_displayers.lcars_combo', 'class_name': 'LCARSComboDisplayer', 'name': 'Combo (LCARS)'},
+    {'key': 'graph', 'module': 'data_displayers.graph', 'class_name': 'GraphDisplayer', 'name': 'Graph'},
+    {'key': 'indicator', 'module': 'data_displayers.indicator', 'class_name': 'IndicatorDisplayer', 'name': 'Indicator'},
+    {'key': 'level_bar', 'module': 'data_displayers.level_bar', 'class_name': 'LevelBarDisplayer', 'name': 'Level Bar'},
+    {'key': 'speedometer', 'module': 'data_displayers.speedometer', 'class_name': 'SpeedometerDisplayer', 'name': 'Speedometer'},
+    {'key': 'static', 'module': 'data_displayers.static', 'class_name': 'StaticDisplayer', 'name': 'Static Image/Text'},
+    {'key': 'text', 'module': 'data_displayers.text', 'class_name': 'TextDisplayer', 'name': 'Text'},
+    {'key': 'table', 'module': 'data_displayers.table', 'class_name': 'TableDisplayer', 'name': 'Table'},
+    {'key': 'cpu_multicore', 'module': 'data_displayers.cpu_multicore', 'class_name': 'CpuMultiCoreDisplayer', 'name': 'Multi-Core Bars'},
+], key=lambda x: x['name'])
 
+def _publish_metadata():
+    """
+    Publishes every declared source and displayer without importing anything.
+    Classes are attached later by register_modules() or resolve_class().
+    """
     for meta in SOURCE_METADATA:
-        class_name = meta['class_name']
-        if class_name in ALL_SOURCE_CLASSES:
-            AVAILABLE_DATA_SOURCES[meta['key']] = meta.copy()
-            AVAILABLE_DATA_SOURCES[meta['key']]['class'] = ALL_SOURCE_CLASSES[class_name]
-
+        AVAILABLE_DATA_SOURCES[meta['key']] = meta.copy()
     for meta in DISPLAYER_METADATA:
-        class_name = meta['class_name']
-        if class_name in ALL_DISPLAYER_CLASSES:
-            AVAILABLE_DISPLAYERS[meta['key']] = meta.copy()
-            AVAILABLE_DISPLAYERS[meta['key']]['class'] = ALL_DISPLAYER_CLASSES[class_name]
+        AVAILABLE_DISPLAYERS[meta['key']] = meta.copy()
+    _build_sorted_lists()
+
+def _build_sorted_lists():
+    """
+    Rebuilds SORTED_DATA_SOURCES and SORTED_DISPLAYERS. The metadata tables are
+    already sorted by name, so their order is reused instead of sorting again.
+    """
+    global SORTED_DATA_SOURCES, SORTED_DISPLAYERS
+    SORTED_DATA_SOURCES = tuple(AVAILABLE_DATA_SOURCES[meta['key']] for meta in SOURCE_METADATA if meta['key'] in AVAILABLE_DATA_SOURCES)
+    SORTED_DISPLAYERS = tuple(AVAILABLE_DISPLAYERS[meta['key']] for meta in DISPLAYER_METADATA if meta['key'] in AVAILABLE_DISPLAYERS)
+
+_publish_metadata()
+
+def resolve_class(meta):
+    """
+    Returns the class for a registry entry, importing its module on first use
+    and caching the class back into the entry.
+    """
+    cls = meta.get('class')
+    if cls is None:
+        cls = _import_class(meta)
+        meta['class'] = cls
+    return cls
+
+def _register_classes(source_classes, displayer_classes):
+    """
+    Attaches loaded classes to their registry entries and drops entries whose
+    module could not be imported. The dictionaries are updated in place so
+    references held elsewhere stay valid.
+    """
+    for registry, classes in ((AVAILABLE_DATA_SOURCES, source_classes), (AVAILABLE_DISPLAYERS, displayer_classes)):
+        for key, info in list(registry.items()):
+            cls = classes.get(info['class_name'])
+            if cls is None:
+                del registry[key]
+            else:
+                info['class'] = cls
+    _build_sorted_lists()
+
+def load_all_modules():
+    """
+    Imports every source and displayer module and returns the discovered
+    classes as (source_classes, displayer_classes) without touching the
+    global dictionaries, so it is safe to call from a background thread.
+    Pass the result to register_modules() on the main thread.
+    """
+    return _load_classes(SOURCE_METADATA), _load_classes(DISPLAYER_METADATA)
+
+def register_modules(source_classes, displayer_classes):
+    """Publishes classes returned by load_all_modules(). Main thread only."""
+    _register_classes(source_classes, displayer_classes)
+
+def discover_and_load_modules():
+    """
+    Loads every declared source and displayer module and populates
+    the global dictionaries with their classes and metadata.
+    """
+    _register_classes(*load_all_modules())
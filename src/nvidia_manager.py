@@ -1,31 +1,44 @@
 # nvidia_manager.py
 # A singleton manager for handling all NVML (NVIDIA Management Library) interactions.
 import os
-import glob
+import time
+from collections import namedtuple
 
-try:
-    import pynvml
-    PYNML_AVAILABLE = True
-except ImportError:
-    PYNML_AVAILABLE = False
+# All metrics for one GPU, read in a single poll_all() pass. Fields are None
+# when the corresponding NVML query is unsupported or fails.
+GPUSnapshot = namedtuple("GPUSnapshot", [
+    "temperature", "utilization", "mem_percent", "mem_used_gb", "mem_total_gb",
+    "power_w", "fan_pct", "gfx_clock", "proc_count"
+])
 
-class NVMLManager:
-    _instance = None
+_DRM_PATH = "/sys/class/drm"
+# NVIDIA's PCI vendor ID, as read raw from sysfs
+_NVIDIA_VENDOR_ID = b"0x10de"
+
+class _NVMLUnavailable(Exception):
+    """Never raised; stands in for pynvml.NVMLError until NVML is initialized."""
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(NVMLManager, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+class NVMLManager:
+    # Use the module-level nvml_manager instance rather than creating another.
+    __slots__ = (
+        'nvml_is_available', 'device_count', 'device_handles', '_NVMLError', '_pynvml',
+        '_get_temp', '_get_util', '_get_mem', '_get_power', '_get_fan', '_get_clock',
+        '_get_procs', '_TEMP_GPU', '_CLK_GFX', '_snapshot_cache', '_snapshot_ttl_ns',
+    )
 
     def __init__(self):
-        if self._initialized:
-            return
-        
         self.nvml_is_available = False
         self.device_count = 0
-        self.device_handles = []
-        self._initialized = True
+        # Only populated while NVML is usable, so the IndexError raised when
+        # indexing it also covers the availability check in the hot getters.
+        self.device_handles = ()
+        self._NVMLError = _NVMLUnavailable
+        # pynvml is imported by init() only when sysfs reports an NVIDIA card
+        self._pynvml = None
+        # gpu_index -> (monotonic_ns, GPUSnapshot). Panels sharing a GPU within
+        # one refresh cycle reuse the same snapshot instead of querying NVML.
+        self._snapshot_cache = {}
+        self._snapshot_ttl_ns = 200_000_000
 
     def init(self):
         """Initializes the manager, first checking for physical hardware
@@ -33,131 +46,219 @@ class NVMLManager:
         
         # --- NEW: Robust hardware check using sysfs ---
         sysfs_device_count = 0
-        drm_path = "/sys/class/drm/"
-        if os.path.isdir(drm_path):
-            card_paths = sorted(glob.glob(os.path.join(drm_path, "card[0-9]*")))
-            for card_path in card_paths:
-                try:
-                    vendor_path = os.path.join(card_path, "device/vendor")
-                    with open(vendor_path, 'r') as f:
-                        vendor_id = f.read().strip()
-                    # NVIDIA's PCI vendor ID is 0x10de
-                    if vendor_id == "0x10de":
+        try:
+            with os.scandir(_DRM_PATH) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.startswith("card") or not name[4:].isdigit():
+                        continue  # Skips connectors such as card0-DP-1
+                    try:
+                        fd = os.open(os.path.join(entry.path, "device/vendor"), os.O_RDONLY)
+                        try:
+                            vendor_id = os.read(fd, 8)
+                        finally:
+                            os.close(fd)
+                    except OSError:
+                        continue # Ignore errors on non-GPU devices
+                    if vendor_id.startswith(_NVIDIA_VENDOR_ID):
                         sysfs_device_count += 1
-                except Exception:
-                    continue # Ignore errors on non-GPU devices
+        except OSError:
+            pass # No DRM subsystem
+
+        if sysfs_device_count == 0:
+            # No NVIDIA hardware, so the native library is never loaded
+            self.device_count = 0
+            self.nvml_is_available = False
+            return
 
         # --- MODIFIED: NVML initialization ---
-        if not PYNML_AVAILABLE:
+        try:
+            import pynvml
+        except ImportError:
             print("pynvml library not found. NVIDIA GPU monitoring is disabled.")
             self.device_count = sysfs_device_count # Still report presence
             self.nvml_is_available = False
             return
+        self._pynvml = pynvml
 
         try:
             pynvml.nvmlInit()
             self.device_count = pynvml.nvmlDeviceGetCount()
-            self.device_handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(self.device_count)]
+            self.device_handles = tuple(pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(self.device_count))
+            self._bind_nvml_functions()
             self.nvml_is_available = True
             print(f"NVML initialized successfully. Found {self.device_count} NVIDIA GPU(s).")
         except pynvml.NVMLError as e:
             print(f"Failed to initialize NVML: {e}. NVIDIA GPU data will be unavailable.")
             self.nvml_is_available = False
-            # --- FALLBACK: Use sysfs count if NVML fails but hardware exists ---
-            if sysfs_device_count > 0:
-                self.device_count = sysfs_device_count
-                print(f"Detected {sysfs_device_count} NVIDIA GPU(s) via sysfs, but NVML failed. The card might be in a low-power state.")
-            else:
-                self.device_count = 0
+            self.device_handles = ()
+            # --- FALLBACK: Use sysfs count since NVML failed but hardware exists ---
+            self.device_count = sysfs_device_count
+            print(f"Detected {sysfs_device_count} NVIDIA GPU(s) via sysfs, but NVML failed. The card might be in a low-power state.")
+
+    def _bind_nvml_functions(self):
+        """Resolves the pynvml functions and constants used by the getters once."""
+        pynvml = self._pynvml
+        self._NVMLError = pynvml.NVMLError
+        self._get_temp = pynvml.nvmlDeviceGetTemperature
+        self._get_util = pynvml.nvmlDeviceGetUtilizationRates
+        self._get_mem = pynvml.nvmlDeviceGetMemoryInfo
+        self._get_power = pynvml.nvmlDeviceGetPowerUsage
+        self._get_fan = pynvml.nvmlDeviceGetFanSpeed
+        self._get_clock = pynvml.nvmlDeviceGetClockInfo
+        self._get_procs = pynvml.nvmlDeviceGetComputeRunningProcesses
+        self._TEMP_GPU = pynvml.NVML_TEMPERATURE_GPU
+        self._CLK_GFX = pynvml.NVML_CLOCK_GRAPHICS
 
     def shutdown(self):
         """Shuts down the NVML library."""
         if self.nvml_is_available:
             try:
-                pynvml.nvmlShutdown()
+                self._pynvml.nvmlShutdown()
                 print("NVML shut down successfully.")
-            except pynvml.NVMLError as e:
+            except self._NVMLError as e:
                 print(f"Failed to shut down NVML: {e}")
             self.nvml_is_available = False
+            self.device_handles = ()
+        self._snapshot_cache.clear()
+
+    def invalidate(self, gpu_index=None):
+        """Drops the cached snapshot for one GPU, or for all GPUs if no index is given."""
+        if gpu_index is None:
+            self._snapshot_cache.clear()
+        else:
+            self._snapshot_cache.pop(gpu_index, None)
+
+    def _handle(self, gpu_index):
+        """
+        Returns the device handle for a GPU index. Raises IndexError for a
+        negative index instead of letting it wrap around to the last GPU.
+        """
+        if gpu_index < 0:
+            raise IndexError(gpu_index)
+        return self.device_handles[gpu_index]
 
     def get_gpu_names(self):
         """Returns a dictionary of GPU indices and their names."""
         if not self.nvml_is_available:
             return {}
-        return {i: pynvml.nvmlDeviceGetName(handle) for i, handle in enumerate(self.device_handles)}
+        return {i: self._pynvml.nvmlDeviceGetName(handle) for i, handle in enumerate(self.device_handles)}
 
     def get_temperature(self, gpu_index):
         """Gets temperature for a specific GPU."""
-        if not self.nvml_is_available or not (0 <= gpu_index < self.device_count):
-            return None
         try:
-            return pynvml.nvmlDeviceGetTemperature(self.device_handles[gpu_index], pynvml.NVML_TEMPERATURE_GPU)
-        except pynvml.NVMLError:
+            h = self._handle(gpu_index)
+            return self._get_temp(h, self._TEMP_GPU)
+        except (IndexError, self._NVMLError):
             return None
 
     def get_utilization(self, gpu_index):
         """Gets GPU utilization for a specific GPU."""
-        if not self.nvml_is_available or not (0 <= gpu_index < self.device_count):
-            return None
         try:
-            return pynvml.nvmlDeviceGetUtilizationRates(self.device_handles[gpu_index]).gpu
-        except pynvml.NVMLError:
+            h = self._handle(gpu_index)
+            return self._get_util(h).gpu
+        except (IndexError, self._NVMLError):
             return None
 
     def get_graphics_clock(self, gpu_index):
         """Gets current graphics clock speed for a specific GPU."""
-        if not self.nvml_is_available or not (0 <= gpu_index < self.device_count):
-            return None
         try:
-            return pynvml.nvmlDeviceGetClockInfo(self.device_handles[gpu_index], pynvml.NVML_CLOCK_GRAPHICS)
-        except pynvml.NVMLError:
+            h = self._handle(gpu_index)
+            return self._get_clock(h, self._CLK_GFX)
+        except (IndexError, self._NVMLError):
             return None
 
     def get_vram_usage(self, gpu_index):
         """Gets VRAM usage statistics for a specific GPU."""
-        if not self.nvml_is_available or not (0 <= gpu_index < self.device_count):
-            return None
         try:
-            mem_info = pynvml.nvmlDeviceGetMemoryInfo(self.device_handles[gpu_index])
+            h = self._handle(gpu_index)
+            mem_info = self._get_mem(h)
             if mem_info.total > 0:
                 return {
                     "percent": (mem_info.used / mem_info.total) * 100,
                     "used_gb": mem_info.used / (1024**3),
                     "total_gb": mem_info.total / (1024**3)
                 }
-        except pynvml.NVMLError:
+        except (IndexError, self._NVMLError):
             return None
         return None
 
     def get_power_usage(self, gpu_index):
         """Gets current power usage in Watts for a specific GPU."""
-        if not self.nvml_is_available or not (0 <= gpu_index < self.device_count):
-            return None
         try:
+            h = self._handle(gpu_index)
             # Power is returned in milliwatts, so we convert to watts.
-            return pynvml.nvmlDeviceGetPowerUsage(self.device_handles[gpu_index]) / 1000.0
-        except pynvml.NVMLError:
+            return self._get_power(h) / 1000.0
+        except (IndexError, self._NVMLError):
             return None
 
     def get_fan_speed(self, gpu_index):
         """Gets current fan speed as a percentage for a specific GPU."""
-        if not self.nvml_is_available or not (0 <= gpu_index < self.device_count):
-            return None
         try:
+            h = self._handle(gpu_index)
             # This might fail on passively cooled cards, which is fine.
-            return pynvml.nvmlDeviceGetFanSpeed(self.device_handles[gpu_index])
-        except pynvml.NVMLError:
+            return self._get_fan(h)
+        except (IndexError, self._NVMLError):
             return None
 
     def get_running_processes_count(self, gpu_index):
         """Gets the number of running compute processes on a specific GPU."""
-        if not self.nvml_is_available or not (0 <= gpu_index < self.device_count):
-            return None
         try:
-            procs = pynvml.nvmlDeviceGetComputeRunningProcesses(self.device_handles[gpu_index])
+            h = self._handle(gpu_index)
+            procs = self._get_procs(h)
             return len(procs)
-        except pynvml.NVMLError:
+        except (IndexError, self._NVMLError):
+            return None
+
+    def poll_all(self, gpu_index):
+        """
+        Returns a GPUSnapshot for a specific GPU, or None if it is unavailable.
+        Snapshots younger than _snapshot_ttl_ns are served from the cache.
+        """
+        now = time.monotonic_ns()
+        cached = self._snapshot_cache.get(gpu_index)
+        if cached and now - cached[0] < self._snapshot_ttl_ns:
+            return cached[1]
+
+        snapshot = self._read_snapshot(gpu_index)
+        if snapshot is not None:
+            self._snapshot_cache[gpu_index] = (now, snapshot)
+        return snapshot
+
+    def _read_snapshot(self, gpu_index):
+        """
+        Reads every metric for a specific GPU in one pass. Each query is guarded
+        separately since some (e.g. fan speed) fail on certain cards.
+        """
+        try:
+            h = self._handle(gpu_index)
+        except IndexError:
             return None
+        NVMLError = self._NVMLError
+
+        try: temperature = self._get_temp(h, self._TEMP_GPU)
+        except NVMLError: temperature = None
+        try: utilization = self._get_util(h).gpu
+        except NVMLError: utilization = None
+        mem_percent = mem_used_gb = mem_total_gb = None
+        try:
+            mem_info = self._get_mem(h)
+            if mem_info.total > 0:
+                mem_percent = (mem_info.used / mem_info.total) * 100
+                mem_used_gb = mem_info.used / (1024**3)
+                mem_total_gb = mem_info.total / (1024**3)
+        except NVMLError: pass
+        try: power_w = self._get_power(h) / 1000.0
+        except NVMLError: power_w = None
+        try: fan_pct = self._get_fan(h)
+        except NVMLError: fan_pct = None
+        try: gfx_clock = self._get_clock(h, self._CLK_GFX)
+        except NVMLError: gfx_clock = None
+        try: proc_count = len(self._get_procs(h))
+        except NVMLError: proc_count = None
+
+        return GPUSnapshot(temperature, utilization, mem_percent, mem_used_gb, mem_total_gb,
+                           power_w, fan_pct, gfx_clock, proc_count)
 
 # Create a single global instance of the manager
 nvml_manager = NVMLManager()
@@ -3,6 +3,10 @@ from abc import ABC, abstractmethod
 import gi
 import re
 import os
+import time
+import logging
+from functools import lru_cache
+from collections import namedtuple
 gi.require_version("Gtk", "4.0")
 gi.require_version("Pango", "1.0")
 from gi.repository import Gtk, Gdk, GLib, Pango
@@ -11,6 +15,173 @@ from style_manager import style_manager # Import the new style manager
 from config_dialog import ConfigOption, build_ui_from_model, get_config_from_widgets
 from ui_helpers import ScrollingLabel, CustomDialog
 
+log = logging.getLogger(__name__)
+
+@lru_cache(maxsize=16)
+def _parse_bool_str(value):
+    return value.lower() == 'true'
+
+def _to_bool(value):
+    """Coerces a config value ('True'/'False' string or bool) to a bool."""
+    if isinstance(value, str):
+        return _parse_bool_str(value)
+    return bool(value)
+
+@lru_cache(maxsize=64)
+def _parse_float_str(value):
+    return float(value)
+
+@lru_cache(maxsize=64)
+def _path_to_uri(path):
+    """GLib.filename_to_uri() memoized by path; shared by all panels."""
+    return GLib.filename_to_uri(path, None)
+
+@lru_cache(maxsize=8)
+def _alarm_keys(prefix):
+    """Returns the (enable, threshold) alarm config keys for a prefix."""
+    return f"{prefix}enable_alarm", f"{prefix}alarm_high_value"
+
+# --- Panel background builders, keyed by panel_bg_type ---
+# Each appends CSS declarations for the panel's non-alarm background to parts.
+
+_IMAGE_STYLE_RULES = {
+    "tile": ("background-size: auto, auto;", "background-repeat: repeat, no-repeat;"),
+    "stretch": ("background-size: 100% 100%, 100% 100%;", "background-repeat: no-repeat, no-repeat;"),
+}
+_IMAGE_ZOOM_RULES = ("background-size: cover, cover;", "background-repeat: no-repeat, no-repeat;")
+
+def _bg_solid(panel, cfg, parts):
+    parts.append(f"background-color: {cfg.get('panel_bg_color', '#222222')};")
+
+def _bg_image(panel, cfg, parts):
+    image_uri = panel._resolve_background_image_uri(cfg.get("panel_background_image_path"))
+    if not image_uri:
+        _bg_solid(panel, cfg, parts)
+        return
+    overlay_alpha = 1.0 - float(cfg.get("panel_background_image_alpha", 1.0))
+    overlay_color = f"rgba(0, 0, 0, {overlay_alpha:.2f})"
+    parts.append(f"background-image: linear-gradient({overlay_color}, {overlay_color}), url('{image_uri}');")
+    parts.append(f"background-color: {cfg.get('panel_bg_color', '#222222')};")
+    parts.extend(_IMAGE_STYLE_RULES.get(cfg.get("panel_background_image_style", "zoom"), _IMAGE_ZOOM_RULES))
+
+def _bg_gradient_linear(panel, cfg, parts):
+    angle = cfg.get("panel_gradient_linear_angle_deg", "90")
+    color1, color2 = cfg.get("panel_gradient_linear_color1"), cfg.get("panel_gradient_linear_color2")
+    parts.append(f"background-image: linear-gradient({angle}deg, {color1}, {color2});")
+
+def _bg_gradient_radial(panel, cfg, parts):
+    color1, color2 = cfg.get("panel_gradient_radial_color1"), cfg.get("panel_gradient_radial_color2")
+    parts.append(f"background-image: radial-gradient(circle, {color1}, {color2});")
+
+_BG_BUILDERS = {
+    "solid": _bg_solid,
+    "image": _bg_image,
+    "gradient_linear": _bg_gradient_linear,
+    "gradient_radial": _bg_gradient_radial,
+}
+
+# Gesture constants resolved once instead of on every click
+_CTRL_MASK = int(Gdk.ModifierType.CONTROL_MASK)
+_SHIFT_MASK = int(Gdk.ModifierType.SHIFT_MASK)
+_BUTTON_PRIMARY = Gdk.BUTTON_PRIMARY
+_BUTTON_SECONDARY = Gdk.BUTTON_SECONDARY
+
+# Bits of BasePanel._parent_caps
+_CAP_COPY_CONFIG = 1
+_CAP_SELECTION = 2
+
+PANEL_CSS_CLASS = "gsens-panel"
+SELECTED_CSS_CLASS = "panel-selected"
+ALARM_ON_CSS_CLASS = "panel-alarm-on"
+_ALARM_ON_RULE_PREFIX = f".{ALARM_ON_CSS_CLASS} {{ background: ".encode()
+
+# Panel border settings from [GridLayout], parsed once per config_manager.grid_style_version
+GridFrameStyle = namedtuple("GridFrameStyle", ["show_borders", "radius", "width", "border_color", "selected_border_color"])
+_grid_frame_style_cache = (None, None)
+
+def _get_grid_frame_style():
+    global _grid_frame_style_cache
+    version, style = _grid_frame_style_cache
+    if version != config_manager.grid_style_version:
+        grid_layout_config = config_manager.config["GridLayout"]
+        style = GridFrameStyle(
+            show_borders=_to_bool(grid_layout_config.get("show_panel_borders", "True")),
+            radius=int(grid_layout_config.get("panel_border_radius", 4)),
+            width=int(grid_layout_config.get("panel_border_width", 1)),
+            border_color=grid_layout_config.get("panel_border_color"),
+            selected_border_color=grid_layout_config.get("selected_panel_border_color"),
+        )
+        _grid_frame_style_cache = (config_manager.grid_style_version, style)
+    return style
+
+# Border rules are the same for every panel, so they live in one display-wide
+# provider keyed on style classes instead of being repeated in each panel's CSS.
+_shared_frame_provider = None
+_shared_frame_css_version = None
+
+def _ensure_shared_frame_css():
+    """(Re)loads the display-wide panel border rules if the GridLayout style changed."""
+    global _shared_frame_provider, _shared_frame_css_version
+    if _shared_frame_css_version == config_manager.grid_style_version:
+        return
+    grid_style = _get_grid_frame_style()
+    if _shared_frame_provider is None:
+        _shared_frame_provider = Gtk.CssProvider()
+        Gtk.StyleContext.add_provider_for_display(Gdk.Display.get_default(), _shared_frame_provider, Gtk.STYLE_PROVIDER_PRIORITY_USER)
+
+    width_val = grid_style.width
+    if grid_style.show_borders:
+        border_css = f"border: {width_val}px solid {grid_style.border_color};"
+    else:
+        border_css = "border-style: none; border-width: 0px;"
+    if grid_style.show_borders and width_val > 0:
+        selected_width = max(1, width_val + BasePanel.SELECTED_BORDER_WIDTH_ADDITION)
+    else:
+        selected_width = BasePanel.SELECTED_BORDER_WIDTH_ADDITION
+    css_data = (
+        f"frame.{PANEL_CSS_CLASS} {{ border-radius: {grid_style.radius}px; {border_css} }} "
+        f"frame.{PANEL_CSS_CLASS}.{SELECTED_CSS_CLASS} {{ border: {selected_width}px solid {grid_style.selected_border_color}; }}"
+    )
+    try:
+        _shared_frame_provider.load_from_data(css_data.encode())
+    except GLib.Error as e:
+        log.error("CSS frame parse error: %s\nCSS: %s", e, css_data)
+    _shared_frame_css_version = config_manager.grid_style_version
+
+# panel_id -> (grid, width_units, height_units), flushed by one idle callback so a
+# burst of configuration applies (e.g. loading a layout) relayouts the grid once.
+_pending_dim_updates = {}
+_dim_flush_scheduled = False
+
+def _flush_dim_updates():
+    global _dim_flush_scheduled
+    _dim_flush_scheduled = False
+    updates_by_grid = {}
+    for panel_id, (grid, width_units, height_units) in _pending_dim_updates.items():
+        updates_by_grid.setdefault(grid, []).append((panel_id, width_units, height_units))
+    _pending_dim_updates.clear()
+    for grid, updates in updates_by_grid.items():
+        try:
+            grid.handle_panel_dimension_updates(updates)
+        except Exception as e:
+            log.warning("Could not notify grid parent of dimension change: %s", e)
+    return GLib.SOURCE_REMOVE
+
+# Panels whose selection changed, restyled together by one idle callback so a
+# rubberband drag does not restyle every panel on each motion event.
+_pending_selection_repaints = set()
+_selection_flush_scheduled = False
+
+def _flush_selection_repaints():
+    global _selection_flush_scheduled
+    _selection_flush_scheduled = False
+    panels = list(_pending_selection_repaints)
+    _pending_selection_repaints.clear()
+    for panel in panels:
+        if panel._frame_css_provider is not None: # Skip panels closed since queuing
+            panel.apply_panel_frame_style()
+    return GLib.SOURCE_REMOVE
+
 class BasePanelMeta(type(Gtk.Frame), type(ABC)):
     pass
 
@@ -30,6 +201,15 @@ class BasePanelABC(ABC):
 class BasePanel(Gtk.Frame, BasePanelABC, metaclass=BasePanelMeta):
     SELECTED_BORDER_WIDTH_ADDITION = 1 
     ALARM_FLASH_INTERVAL_MS = 500
+    IMAGE_CHECK_INTERVAL_S = 5.0
+    # (key, converter, default) applied to the panel config on construction.
+    # A converter of None only fills in the default, leaving existing values as they are.
+    _CONFIG_DEFAULTS = (
+        ("width", int, 2), ("height", int, 2), ("grid_x", int, 0), ("grid_y", int, 0),
+        ("enable_collision", None, "True"), ("z_order", None, "0"),
+        ("title_color", str, "#FFFFFF"), ("title_font", str, "Sans Bold 10"),
+        ("text_color", None, "#E0E0E0"), ("font", None, "Sans 10"), ("cell_size", None, 64),
+    )
 
     def __init__(self, title="", config=None):
         super().__init__()
@@ -38,14 +218,36 @@ class BasePanel(Gtk.Frame, BasePanelABC, metaclass=BasePanelMeta):
         self.set_margin_start(2)
         self.set_margin_end(2)
 
+        # PyGObject wrappers always carry an instance __dict__, so __slots__ would
+        # not remove it. Instead every instance attribute, including the widgets
+        # built by init_ui() and setup_context_menu(), is created here in one block
+        # so the dict is filled once rather than growing across helper calls.
         self.original_title = title
         self.config = config or {} 
         self._timeout_id = None
         self._config_dialog = None 
-        
+        self.box = None
+        self.title_label = None
+        self.content_area = None
+        self.popover = None
+        # Grid interactions the current parent supports, refreshed when the parent changes
+        self._parent_caps = 0
+        
+        # Borders and selection come from the shared provider via style classes;
+        # this provider only carries the panel's own background and alarm colour.
+        self.add_css_class(PANEL_CSS_CLASS)
         self._frame_css_provider = Gtk.CssProvider()
         self.get_style_context().add_provider(self._frame_css_provider, Gtk.STYLE_PROVIDER_PRIORITY_USER)
         self._title_label_css_provider = None 
+        # Encoded non-alarm background rules, rebuilt by apply_all_configurations()
+        self._background_css = None
+        # Last CSS loaded into _frame_css_provider, to skip identical reloads
+        self._last_frame_css = None
+        # (image_path, image_uri or None, monotonic check time) for the background image
+        self._image_uri_cache = (None, None, 0.0)
+        # Set when a restyle was skipped while unmapped; applied again on "map"
+        self._style_dirty = False
+        self.connect("map", self._on_map_apply_pending_style)
 
         self.is_selected = False 
 
@@ -53,43 +255,50 @@ class BasePanel(Gtk.Frame, BasePanelABC, metaclass=BasePanelMeta):
         self._alarm_flash_on = False
         self._alarm_flash_timer_id = None
         self._current_alarm_flash_color = None
+        # Displayer drawing area redrawn on alarm flashes; set by subclasses that have one
+        self._graph_area = None
         
         self.config["id"] = self.config.get("id", "panel_" + title.lower().replace(" ", "_") + "_" + str(id(self))[:5])
         self.config["name"] = self.config.get("name", self.config["id"]) 
-        self.config["width"] = int(self.config.get("width", "2"))
-        self.config["height"] = int(self.config.get("height", "2"))
-        self.config["grid_x"] = int(self.config.get("grid_x", "0"))
-        self.config["grid_y"] = int(self.config.get("grid_y", "0"))
-        self.config["title_text"] = str(self.config.get("title_text", self.original_title))
-        
-        self.config.setdefault("enable_collision", "True")
-        self.config.setdefault("z_order", "0")
-        
-        show_title_val = self.config.get("show_title", True)
-        self.config["show_title"] = str(show_title_val).lower() == 'true' if isinstance(show_title_val, str) else bool(show_title_val)
-        
-        self.config["title_color"] = str(self.config.get("title_color", "#FFFFFF"))
-        self.config["title_font"] = str(self.config.get("title_font", "Sans Bold 10"))
-        self.config.setdefault("text_color", "#E0E0E0") 
-        self.config.setdefault("font", "Sans 10")      
-        self.config.setdefault("cell_size", 64) 
+        config = self.config
+        for key, convert, default in self._CONFIG_DEFAULTS:
+            value = config.get(key, default)
+            config[key] = value if convert is None or type(value) is convert else convert(value)
+        config["title_text"] = str(config.get("title_text", self.original_title))
+        config["show_title"] = _to_bool(config.get("show_title", True))
+        # Config key holding the alarm flash colour; refreshed by apply_all_configurations()
+        self._alarm_color_key = self._find_alarm_color_key()
 
         self.set_name(self.config["name"]) 
+        # The widget name never changes, so the CSS selector is encoded once
+        self._css_selector_bytes = f"frame#{self.get_name()}".encode()
 
         self.init_ui() 
         self.setup_context_menu() 
+        self.connect("notify::parent", self._on_parent_changed)
 
     def _alarm_flash_callback(self):
         if not self.is_in_alarm_state: 
             return GLib.SOURCE_REMOVE 
         
+        # Already on the main loop, so restyle and queue the redraw directly
         self._alarm_flash_on = not self._alarm_flash_on
-        GLib.idle_add(self.apply_panel_frame_style) 
-        if hasattr(self, 'data_displayer') and hasattr(self.data_displayer, 'graph_area') and \
-           self.data_displayer.graph_area and self.data_displayer.graph_area.get_visible():
-            GLib.idle_add(self.data_displayer.graph_area.queue_draw)
+        if not self.get_mapped():
+            self._style_dirty = True
+            return GLib.SOURCE_CONTINUE
+        self._sync_alarm_flash_class()
+        self._queue_graph_redraw()
         return GLib.SOURCE_CONTINUE
 
+    def _on_map_apply_pending_style(self, widget):
+        if self._style_dirty:
+            self.apply_panel_frame_style()
+
+    def _queue_graph_redraw(self):
+        graph_area = self._graph_area
+        if graph_area is not None and graph_area.get_visible():
+            graph_area.queue_draw()
+
     def enter_alarm_state(self, flash_color=None):
         if self.is_in_alarm_state:
             return
@@ -99,15 +308,13 @@ class BasePanel(Gtk.Frame, BasePanelABC, metaclass=BasePanelMeta):
         if flash_color:
             self._current_alarm_flash_color = flash_color
         else:
-            alarm_color_key = next((k for k in self.config if k.endswith("alarm_color")), None)
-            self._current_alarm_flash_color = self.config.get(alarm_color_key, 'rgba(255,0,0,0.6)')
+            self._current_alarm_flash_color = self.config.get(self._alarm_color_key, 'rgba(255,0,0,0.6)')
 
         if self._alarm_flash_timer_id is None:
             self._alarm_flash_timer_id = GLib.timeout_add(self.ALARM_FLASH_INTERVAL_MS, self._alarm_flash_callback)
+        # Loads the alarm colour rule once; flash ticks only toggle a style class
         self.apply_panel_frame_style()
-        if hasattr(self, 'data_displayer') and hasattr(self.data_displayer, 'graph_area') and \
-           self.data_displayer.graph_area and self.data_displayer.graph_area.get_visible():
-             GLib.idle_add(self.data_displayer.graph_area.queue_draw)
+        self._queue_graph_redraw()
 
     def exit_alarm_state(self):
         if not self.is_in_alarm_state:
@@ -120,33 +327,33 @@ class BasePanel(Gtk.Frame, BasePanelABC, metaclass=BasePanelMeta):
             self._alarm_flash_timer_id = None
         
         self.apply_panel_frame_style()
-        
-        if hasattr(self, 'data_displayer') and hasattr(self.data_displayer, 'graph_area') and \
-           self.data_displayer.graph_area and self.data_displayer.graph_area.get_visible():
-             GLib.idle_add(self.data_displayer.graph_area.queue_draw)
+        self._queue_graph_redraw()
 
     def check_and_update_alarm_state(self, current_value, alarm_config_prefix=""):
-        enable_alarm_key = f"{alarm_config_prefix}enable_alarm"
-        alarm_high_value_key = f"{alarm_config_prefix}alarm_high_value"
+        enable_alarm_key, alarm_high_value_key = _alarm_keys(alarm_config_prefix)
         
-        alarm_enabled = str(self.config.get(enable_alarm_key, "False")).lower() == 'true'
+        alarm_enabled = _to_bool(self.config.get(enable_alarm_key, "False"))
         try:
-            alarm_high_value = float(self.config.get(alarm_high_value_key, "80.0"))
+            alarm_high_value = _parse_float_str(self.config.get(alarm_high_value_key, "80.0"))
         except (ValueError, TypeError):
             alarm_high_value = 80.0 
-            print(f"Warning: Invalid alarm_high_value for {self.config['id']}. Using default.")
+            log.warning("Invalid alarm_high_value for %s. Using default.", self.config['id'])
 
         if alarm_enabled and current_value is not None and current_value > alarm_high_value:
             self.enter_alarm_state()
         else: 
             self.exit_alarm_state()
 
+    def _find_alarm_color_key(self):
+        return next((k for k in self.config if k.endswith("alarm_color")), None)
+
     def apply_all_configurations(self):
+        self._background_css = None
+        self._alarm_color_key = self._find_alarm_color_key()
         self.apply_panel_frame_style() 
 
-        if hasattr(self, 'title_label'): 
-            show_title_val = self.config.get("show_title", True)
-            is_title_visible = str(show_title_val).lower() == 'true' if isinstance(show_title_val, str) else bool(show_title_val)
+        if self.title_label is not None: 
+            is_title_visible = _to_bool(self.config.get("show_title", True))
 
             self.title_label.set_visible(is_title_visible)
             if is_title_visible:
@@ -160,15 +367,19 @@ class BasePanel(Gtk.Frame, BasePanelABC, metaclass=BasePanelMeta):
         self.set_standard_size_and_notify_grid()
 
     def _notify_grid_parent_of_dimension_change(self):
+        global _dim_flush_scheduled
         parent_grid = self.get_parent()
         try:
-            if parent_grid and parent_grid.__class__.__name__ == "GridLayoutManager":
+            if parent_grid is not None and hasattr(parent_grid, 'handle_panel_dimension_updates'):
                 panel_id = self.config["id"]
                 width_units = int(self.config["width"])
                 height_units = int(self.config["height"])
-                parent_grid.handle_panel_dimension_update(panel_id, width_units, height_units)
+                _pending_dim_updates[panel_id] = (parent_grid, width_units, height_units)
+                if not _dim_flush_scheduled:
+                    _dim_flush_scheduled = True
+                    GLib.idle_add(_flush_dim_updates)
         except Exception as e:
-            print(f"Warning: Could not notify grid parent of dimension change: {e}")
+            log.warning("Could not notify grid parent of dimension change: %s", e)
 
     def set_standard_size_and_notify_grid(self):
         try:
@@ -177,79 +388,84 @@ class BasePanel(Gtk.Frame, BasePanelABC, metaclass=BasePanelMeta):
             cell_size = int(self.config.get("cell_size", 64))
             self.set_size_request(width_units * cell_size, height_units * cell_size)
         except (ValueError, TypeError) as e:
-            print(f"Error setting size request for panel {self.config.get('id')}: {e}. Using default size.")
+            log.warning("Error setting size request for panel %s: %s. Using default size.", self.config.get('id'), e)
             self.set_size_request(2 * 64, 2 * 64)
         
         self._notify_grid_parent_of_dimension_change() 
 
-    def apply_panel_frame_style(self):
+    def _resolve_background_image_uri(self, image_path):
+        """Returns the file URI for image_path, or None if it does not exist. Rechecked at most every IMAGE_CHECK_INTERVAL_S."""
+        if not image_path:
+            return None
+        cached_path, cached_uri, checked_at = self._image_uri_cache
+        now = time.monotonic()
+        if image_path == cached_path and now - checked_at < self.IMAGE_CHECK_INTERVAL_S:
+            return cached_uri
+        image_uri = _path_to_uri(image_path) if os.path.exists(image_path) else None
+        self._image_uri_cache = (image_path, image_uri, now)
+        return image_uri
+
+    def _build_background_css(self):
+        """Returns the panel's non-alarm background rules as encoded CSS declarations."""
         css_parts = []
-        
-        is_in_alarm = self.is_in_alarm_state and self._alarm_flash_on
-        if is_in_alarm:
-            css_parts.append(f"background: {self._current_alarm_flash_color};")
-        else:
-            bg_type = self.config.get("panel_bg_type", "solid")
-            if bg_type == "image":
-                image_path = self.config.get("panel_background_image_path")
-                if image_path and os.path.exists(image_path):
-                    image_uri = GLib.filename_to_uri(image_path, None)
-                    image_alpha = float(self.config.get("panel_background_image_alpha", 1.0))
-                    overlay_alpha = 1.0 - image_alpha
-                    overlay_color = f"rgba(0, 0, 0, {overlay_alpha:.2f})"
-                    css_parts.append(f"background-image: linear-gradient({overlay_color}, {overlay_color}), url('{image_uri}');")
-                    css_parts.append(f"background-color: {self.config.get('panel_bg_color', '#222222')};")
-                    image_style = self.config.get("panel_background_image_style", "zoom")
-                    if image_style == "tile":
-                        css_parts.extend(["background-size: auto, auto;", "background-repeat: repeat, no-repeat;"])
-                    elif image_style == "stretch":
-                        css_parts.extend(["background-size: 100% 100%, 100% 100%;", "background-repeat: no-repeat, no-repeat;"])
-                    else: 
-                        css_parts.extend(["background-size: cover, cover;", "background-repeat: no-repeat, no-repeat;"])
-                else:
-                    css_parts.append(f"background-color: {self.config.get('panel_bg_color', '#222222')};")
-            elif bg_type == "gradient_linear":
-                angle = self.config.get("panel_gradient_linear_angle_deg", "90")
-                color1, color2 = self.config.get("panel_gradient_linear_color1"), self.config.get("panel_gradient_linear_color2")
-                css_parts.append(f"background-image: linear-gradient({angle}deg, {color1}, {color2});")
-            elif bg_type == "gradient_radial":
-                color1, color2 = self.config.get("panel_gradient_radial_color1"), self.config.get("panel_gradient_radial_color2")
-                css_parts.append(f"background-image: radial-gradient(circle, {color1}, {color2});")
-            else: 
-                css_parts.append(f"background-color: {self.config.get('panel_bg_color', '#222222')};")
-        
-        grid_layout_config = config_manager.config["GridLayout"]
-        global_show_borders = grid_layout_config.get("show_panel_borders", "True").lower() == 'true'
-        radius_val = int(grid_layout_config.get("panel_border_radius", 4))
-        width_val = int(grid_layout_config.get("panel_border_width", 1))
-        
-        css_parts.append(f"border-radius: {radius_val}px;")
-        
-        final_border_color = grid_layout_config.get("panel_border_color")
-        final_border_width = width_val
-        apply_border = global_show_borders
-        
-        if self.is_selected:
-            final_border_color = grid_layout_config.get("selected_panel_border_color")
-            final_border_width = max(1, width_val + self.SELECTED_BORDER_WIDTH_ADDITION) if global_show_borders and width_val > 0 else self.SELECTED_BORDER_WIDTH_ADDITION
-            apply_border = True
+        cfg = self.config
+        _BG_BUILDERS.get(cfg.get("panel_bg_type", "solid"), _bg_solid)(self, cfg, css_parts)
+        return ' '.join(css_parts).encode()
+
+    def _compose_frame_css(self):
+        """Returns the encoded per-panel CSS: the background plus, while in alarm, the flash colour."""
+        if self._background_css is None:
+            self._background_css = self._build_background_css()
+        selector = self._css_selector_bytes
+        buf = bytearray(selector)
+        buf += b" { "
+        buf += self._background_css
+        buf += b" }"
+        if self.is_in_alarm_state:
+            buf += b" "
+            buf += selector
+            buf += _ALARM_ON_RULE_PREFIX
+            buf += self._current_alarm_flash_color.encode()
+            buf += b"; }"
+        return bytes(buf)
+
+    def _load_frame_css(self, css_data):
+        if css_data == self._last_frame_css:
+            return
+        self._last_frame_css = css_data
+        try:
+            self._frame_css_provider.load_from_data(css_data)
+        except GLib.Error as e:
+            log.error("CSS frame parse error: %s\nCSS: %s", e, css_data.decode())
 
-        if apply_border:
-            css_parts.append(f"border: {final_border_width}px solid {final_border_color};")
+    def _set_css_class(self, css_class, enabled):
+        if enabled:
+            self.add_css_class(css_class)
         else:
-            css_parts.append("border-style: none; border-width: 0px;")
+            self.remove_css_class(css_class)
 
-        selector = f"frame#{self.get_name()}"
-        css_data = f"{selector} {{ {' '.join(css_parts)} }}"
-        try:
-            self._frame_css_provider.load_from_data(css_data.encode())
-        except GLib.Error as e:
-            print(f"!!! CSS FRAME PARSE ERROR: {e}\nCSS: {css_data}")
+    def _sync_alarm_flash_class(self):
+        self._set_css_class(ALARM_ON_CSS_CLASS, self.is_in_alarm_state and self._alarm_flash_on)
+
+    def apply_panel_frame_style(self):
+        if not self.get_mapped():
+            # Off-screen or not yet shown; restyled once it is mapped
+            self._style_dirty = True
+            return
+        self._style_dirty = False
+        _ensure_shared_frame_css()
+        self._set_css_class(SELECTED_CSS_CLASS, self.is_selected)
+        self._sync_alarm_flash_class()
+        self._load_frame_css(self._compose_frame_css())
 
     def set_selected_visual_indicator(self, is_selected):
+        global _selection_flush_scheduled
         if self.is_selected != is_selected:
             self.is_selected = is_selected
-            self.apply_panel_frame_style() 
+            _pending_selection_repaints.add(self)
+            if not _selection_flush_scheduled:
+                _selection_flush_scheduled = True
+                GLib.idle_add(_flush_selection_repaints)
 
     def init_ui(self):
         self.box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
@@ -319,27 +535,35 @@ class BasePanel(Gtk.Frame, BasePanelABC, metaclass=BasePanelMeta):
         
         self.popover.set_parent(self) 
 
+    def _on_parent_changed(self, widget, pspec):
+        """Records which grid interactions the new parent supports."""
+        parent = self.get_parent()
+        caps = 0
+        if hasattr(parent, 'handle_copy_config_request'):
+            caps |= _CAP_COPY_CONFIG
+        if hasattr(parent, 'selected_panel_ids') and hasattr(parent, '_update_selected_panels_visuals'):
+            caps |= _CAP_SELECTION
+        self._parent_caps = caps
+
     def on_gesture_pressed(self, gesture, n_press, x, y):
         parent_grid = self.get_parent()
-        is_multi_selecting_or_dragging = False
-        if hasattr(parent_grid, 'rubberband_active') and parent_grid.rubberband_active:
-            is_multi_selecting_or_dragging = True
-        if hasattr(parent_grid, 'drag_active') and parent_grid.drag_active:
-            is_multi_selecting_or_dragging = True
+        is_multi_selecting_or_dragging = getattr(parent_grid, 'rubberband_active', False) or \
+                                         getattr(parent_grid, 'drag_active', False)
 
         event = gesture.get_current_event()
         if not event: return
 
-        is_ctrl = bool(event.get_modifier_state() & Gdk.ModifierType.CONTROL_MASK)
-        is_shift = bool(event.get_modifier_state() & Gdk.ModifierType.SHIFT_MASK)
+        state = event.get_modifier_state()
+        is_ctrl = bool(state & _CTRL_MASK)
+        is_shift = bool(state & _SHIFT_MASK)
         button = gesture.get_current_button()
         
-        if button == Gdk.BUTTON_PRIMARY and is_ctrl and is_shift:
-            if hasattr(parent_grid, 'handle_copy_config_request'):
+        if button == _BUTTON_PRIMARY and is_ctrl and is_shift:
+            if self._parent_caps & _CAP_COPY_CONFIG:
                 parent_grid.handle_copy_config_request(self.config.get("id"))
             return 
         
-        if button == Gdk.BUTTON_SECONDARY and not is_multi_selecting_or_dragging:
+        if button == _BUTTON_SECONDARY and not is_multi_selecting_or_dragging:
              rect = Gdk.Rectangle()
              rect.x = x
              rect.y = y
@@ -349,8 +573,8 @@ class BasePanel(Gtk.Frame, BasePanelABC, metaclass=BasePanelMeta):
              self.popover.popup()
              return
 
-        if button == Gdk.BUTTON_PRIMARY and not is_multi_selecting_or_dragging:
-            if hasattr(parent_grid, 'selected_panel_ids') and hasattr(parent_grid, '_update_selected_panels_visuals'):
+        if button == _BUTTON_PRIMARY and not is_multi_selecting_or_dragging:
+            if self._parent_caps & _CAP_SELECTION:
                 panel_id = self.config.get("id")
                 if is_ctrl:
                     if panel_id in parent_grid.selected_panel_ids:
@@ -378,7 +602,7 @@ class BasePanel(Gtk.Frame, BasePanelABC, metaclass=BasePanelMeta):
         if parent_grid and hasattr(parent_grid, 'delete_selected_panels'):
             parent_grid.delete_selected_panels()
         else:
-            print(f"Error: Could not request removal. Parent grid or method not found.")
+            log.error("Could not request removal. Parent grid or method not found.")
 
     def on_bring_forward_clicked(self, button):
         self.popover.popdown()
@@ -463,14 +687,14 @@ class BasePanel(Gtk.Frame, BasePanelABC, metaclass=BasePanelMeta):
         self.popover.popdown()
         displayer_key = self.config.get('displayer_type')
         if not displayer_key:
-            print("Warning: Cannot save defaults, no displayer type found.")
+            log.warning("Cannot save defaults, no displayer type found.")
             return
 
         if self.data_displayer:
             if config_manager.save_displayer_defaults(displayer_key, self.config, self.data_displayer.__class__):
                 print(f"Saved current style as the default for '{displayer_key}'.")
             else:
-                print(f"Error: Could not save default style for '{displayer_key}'.")
+                log.error("Could not save default style for '%s'.", displayer_key)
 
     # --- End of Handlers ---
 
@@ -488,7 +712,7 @@ class BasePanel(Gtk.Frame, BasePanelABC, metaclass=BasePanelMeta):
         if self._frame_css_provider:
             self.get_style_context().remove_provider(self._frame_css_provider)
             self._frame_css_provider = None
-        if self._title_label_css_provider and hasattr(self, 'title_label') and self.title_label:
+        if self._title_label_css_provider and self.title_label:
             self.title_label.get_style_context().remove_provider(self._title_label_css_provider)
             self._title_label_css_provider = None
             
@@ -496,13 +720,17 @@ class BasePanel(Gtk.Frame, BasePanelABC, metaclass=BasePanelMeta):
         config_manager.remove_panel_config(panel_id)
         
     def set_update_interval(self, seconds):
+        """
+        Polls update() every `seconds` whole seconds. The interval is clamped to
+        at least 1 so the timer stays on timeout_add_seconds, which GLib batches
+        with other second-granular wakeups; sub-second polling needs its own timer.
+        """
         if self._timeout_id: 
             GLib.source_remove(self._timeout_id)
             self._timeout_id = None
         try:
-            update_seconds = int(seconds)
-            if update_seconds <= 0: update_seconds = 1 
-        except ValueError: update_seconds = 1 
+            update_seconds = max(1, int(seconds))
+        except (ValueError, TypeError): update_seconds = 1 
         
         should_continue = self.update()
         if not should_continue:
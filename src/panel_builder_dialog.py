@@ -1,15 +1,45 @@
 # panel_builder_dialog.py
 import gi
 import uuid
+from functools import lru_cache
 from config_dialog import ConfigOption, build_ui_from_model, get_config_from_widgets
 from ui_helpers import CustomDialog, build_background_config_ui
 from utils import populate_defaults_from_model
 from config_manager import config_manager
 from sensor_cache import SENSOR_CACHE
+from module_registry import resolve_class
 
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk, GLib
 
+# Combo displayer key -> the combo_mode its ComboDataSource runs in
+_COMBO_MODE = {
+    'level_bar_combo': 'level_bar',
+    'lcars_combo': 'lcars',
+    'arc_combo': 'arc',
+    'dashboard_combo': 'dashboard',
+}
+
+# Sensor-backed source key -> the config key that falls back to its first discovered sensor
+_DEFAULT_SENSOR_KEYS = {
+    'system_temp': 'selected_sensor_key',
+    'fan_speed': 'selected_fan_key',
+}
+
+# Sources whose Data Source tab registers widgets and models from idle callbacks
+# and slot "changed" handlers, which _track_source_additions() cannot see. Their
+# tab is rebuilt on every displayer change instead of being kept.
+_ASYNC_SOURCE_BUILDERS = frozenset({'combo'})
+
+@lru_cache(maxsize=32)
+def _general_model(title, def_w, def_h):
+    """The General tab model for a source's name and default size; models are only read, so it is shared."""
+    return { "General Panel Settings": [
+        ConfigOption("title_text", "string", "Panel Title:", title),
+        ConfigOption("width", "spinner", "Width (grid units):", def_w, 1, 128, 1),
+        ConfigOption("height", "spinner", "Height (grid units):", def_h, 1, 128, 1)
+    ]}
+
 class PanelBuilderDialog:
     """
     A comprehensive dialog for creating a new, fully configured panel from scratch.
@@ -19,6 +49,16 @@ class PanelBuilderDialog:
         self.grid_manager = grid_manager
         self.AVAILABLE_DATA_SOURCES = available_sources
         self.AVAILABLE_DISPLAYERS = available_displayers
+        self._sources_by_key = {s['key']: s for s in available_sources}
+        self._displayers_by_key = {d['key']: d for d in available_displayers}
+        # Source key -> its compatible displayer infos, sorted by name for the combo
+        self._compatible_cache = {
+            s['key']: sorted(
+                (self._displayers_by_key[k] for k in s['displayers'] if k in self._displayers_by_key),
+                key=lambda x: x['name']
+            )
+            for s in available_sources
+        }
 
         self.selected_source_key = None
         self.selected_displayer_key = None
@@ -35,6 +75,28 @@ class PanelBuilderDialog:
         self.dialog.ui_models = {}
         self.dialog.dynamic_models = []
 
+        # Config models for the current selection, prepared by _rebuild_config_tabs()
+        self._source_model = None
+        self._displayer_model = None
+        self._general_model = None
+        # Notebook page -> whether its contents exist for the current selection.
+        # Pages are only built when first shown (or when the panel is created).
+        self._tab_builders = {}
+        self._tab_built = {}
+        # What the Data Source tab added to the shared widget/model registries,
+        # so a displayer-only change can keep that tab as it is
+        self._source_widget_keys = set()
+        self._source_dynamic_models = []
+        self._source_ui_models = {}
+        # Class -> config model, so re-selecting a combo entry doesn't rebuild it
+        self._config_models = {}
+        # Set while _on_source_changed repopulates the displayer combo, whose
+        # "changed" signal would otherwise trigger a second rebuild
+        self._suppress_rebuild = False
+        # Custom builders run from idle; a rebuild bumps the token so stale ones are dropped
+        self._rebuild_token = 0
+        self._pending_custom_builders = []
+
         self._build_ui()
         self.dialog.present()
 
@@ -53,19 +115,26 @@ class PanelBuilderDialog:
         
         notebook = Gtk.Notebook(margin_top=10, margin_bottom=10, margin_start=10, margin_end=10)
         content_area.append(notebook)
+        self.notebook = notebook
 
         main_tab_scroll, main_tab_box = self._create_scrolled_tab_box()
         self._build_main_tab(main_tab_box)
         notebook.append_page(main_tab_scroll, Gtk.Label(label="Type"))
 
         source_scroll, self.source_config_box = self._create_scrolled_tab_box()
-        notebook.append_page(source_scroll, Gtk.Label(label="Data Source"))
+        page = notebook.append_page(source_scroll, Gtk.Label(label="Data Source"))
+        self._tab_builders[page] = self._build_source_tab
+        self._source_page = page
 
         displayer_scroll, self.displayer_config_box = self._create_scrolled_tab_box()
-        notebook.append_page(displayer_scroll, Gtk.Label(label="Display"))
+        page = notebook.append_page(displayer_scroll, Gtk.Label(label="Display"))
+        self._tab_builders[page] = self._build_displayer_tab
         
         general_scroll, self.general_config_box = self._create_scrolled_tab_box()
-        notebook.append_page(general_scroll, Gtk.Label(label="General"))
+        page = notebook.append_page(general_scroll, Gtk.Label(label="General"))
+        self._tab_builders[page] = self._build_general_tab
+        self._tab_built = dict.fromkeys(self._tab_builders, False)
+        notebook.connect("switch-page", self._on_switch_page)
         
         self.dialog.add_non_modal_button("_Cancel", style_class="destructive-action").connect("clicked", lambda w: self.dialog.destroy())
         self.create_button = self.dialog.add_non_modal_button("_Create Panel", style_class="suggested-action", is_default=True)
@@ -117,28 +186,30 @@ class PanelBuilderDialog:
         self.displayer_class = None
         self.create_button.set_sensitive(False)
 
-        self.displayer_model.clear()
-        self.displayer_model.append(["Select a Display Style...", ""])
-        
-        if self.selected_source_key:
-            source_info = next((s for s in self.AVAILABLE_DATA_SOURCES if s['key'] == self.selected_source_key), None)
-            self.source_class = source_info['class']
+        self._suppress_rebuild = True
+        try:
+            # Detach the model while repopulating so the combo doesn't relayout per row
+            self.displayer_combo.set_model(None)
+            self.displayer_model.clear()
+            self.displayer_model.insert_with_valuesv(-1, [0, 1], ["Select a Display Style...", ""])
             
-            compatible_displayers = sorted(
-                [d for d in self.AVAILABLE_DISPLAYERS if d['key'] in source_info['displayers']],
-                key=lambda x: x['name']
-            )
+            if self.selected_source_key:
+                self.source_class = resolve_class(self._sources_by_key[self.selected_source_key])
 
-            for disp_info in compatible_displayers:
-                self.displayer_model.append([disp_info['name'], disp_info['key']])
-            
-            self.displayer_combo.set_active(0)
-            self.displayer_combo.set_sensitive(True)
-        else:
-            self.source_class = None
-            self.displayer_combo.set_sensitive(False)
+                for disp_info in self._compatible_cache[self.selected_source_key]:
+                    self.displayer_model.insert_with_valuesv(-1, [0, 1], [disp_info['name'], disp_info['key']])
+                
+                self.displayer_combo.set_model(self.displayer_model)
+                self.displayer_combo.set_active(0)
+                self.displayer_combo.set_sensitive(True)
+            else:
+                self.source_class = None
+                self.displayer_combo.set_model(self.displayer_model)
+                self.displayer_combo.set_sensitive(False)
+        finally:
+            self._suppress_rebuild = False
         
-        self._rebuild_config_tabs()
+        self._rebuild_config_tabs(reason='source')
 
     def _on_displayer_changed(self, combo):
         """Handles when the user selects a different displayer."""
@@ -148,54 +219,106 @@ class PanelBuilderDialog:
         self.selected_displayer_key = combo.get_model()[tree_iter][1]
         
         if self.selected_displayer_key:
-            self.displayer_class = next(d['class'] for d in self.AVAILABLE_DISPLAYERS if d['key'] == self.selected_displayer_key)
+            self.displayer_class = resolve_class(self._displayers_by_key[self.selected_displayer_key])
             self.create_button.set_sensitive(True)
         else:
             self.displayer_class = None
             self.create_button.set_sensitive(False)
             
-        self._rebuild_config_tabs()
+        self._rebuild_config_tabs(reason='displayer')
 
     def _clear_box(self, box):
         """Removes all children from a Gtk.Box."""
         child = box.get_first_child()
-        while child:
+        while child is not None:
+            next_child = child.get_next_sibling()
             box.remove(child)
-            child = box.get_first_child()
+            child = next_child
+
+    def _model_for(self, cls):
+        """
+        Returns the config model of a source or displayer class, built once per
+        dialog. Not cached process-wide because some models list sensors that are
+        still being discovered in the background.
+        """
+        model = self._config_models.get(cls)
+        if model is None:
+            model = self._config_models[cls] = cls.get_config_model()
+        return model
+
+    def _on_switch_page(self, notebook, page, page_num):
+        self._ensure_tab_built(page_num)
+
+    def _ensure_tab_built(self, page_num):
+        """Builds a configuration page for the current selection if it has not been built yet."""
+        if self._tab_built.get(page_num, True) or self._source_model is None:
+            return
+        self._tab_built[page_num] = True
+        self._tab_builders[page_num]()
+
+    def _rebuild_config_tabs(self, reason='all'):
+        """
+        Resets the configuration tabs for the current selections. The shared
+        config defaults are prepared here; the widgets of each tab are only
+        built when that tab is shown. A displayer-only change ('displayer')
+        keeps the Data Source tab and its widgets, unless the source builds
+        part of that tab asynchronously; 'source' and 'all' reset every tab.
+        """
+        if self._suppress_rebuild:
+            return
+
+        keep_source = (reason == 'displayer' and self._source_model is not None
+                       and self.displayer_class is not None
+                       and self.selected_source_key not in _ASYNC_SOURCE_BUILDERS)
+        source_built = keep_source and self._tab_built[self._source_page]
+        pending_source = [b for b in self._pending_custom_builders if b == self._build_custom_source] if keep_source else []
 
-    def _rebuild_config_tabs(self):
-        """Clears and rebuilds all configuration tabs based on current selections."""
-        self.widgets.clear()
         self.current_config.clear()
-        self.dialog.dynamic_models.clear()
-        self.dialog.ui_models.clear()
+        if keep_source:
+            source_widgets = {k: self.widgets[k] for k in self._source_widget_keys if k in self.widgets}
+            self.widgets.clear()
+            self.widgets.update(source_widgets)
+            self.dialog.dynamic_models[:] = self._source_dynamic_models
+            self.dialog.ui_models.clear()
+            self.dialog.ui_models.update(self._source_ui_models)
+        else:
+            self.widgets.clear()
+            self.dialog.dynamic_models.clear()
+            self.dialog.ui_models.clear()
+            self._source_widget_keys.clear()
+            self._source_dynamic_models.clear()
+            self._source_ui_models.clear()
+            self._clear_box(self.source_config_box)
+        self._source_model = self._displayer_model = self._general_model = None
+        self._tab_built = dict.fromkeys(self._tab_builders, False)
+        self._tab_built[self._source_page] = source_built
+        self._rebuild_token += 1
+        self._pending_custom_builders.clear()
         
-        self._clear_box(self.source_config_box)
         self._clear_box(self.displayer_config_box)
         self._clear_box(self.general_config_box)
 
         if not self.source_class or not self.displayer_class:
             return
 
-        source_info = next((s for s in self.AVAILABLE_DATA_SOURCES if s['key'] == self.selected_source_key), None)
+        source_info = self._sources_by_key[self.selected_source_key]
 
-        source_model = self.source_class.get_config_model()
-        displayer_model = self.displayer_class.get_config_model()
+        source_model = self._model_for(self.source_class)
+        displayer_model = self._model_for(self.displayer_class)
         def_w, def_h = source_info.get("default_size", (2, 2))
-        general_model = { "General Panel Settings": [
-            ConfigOption("title_text", "string", "Panel Title:", source_info["name"]),
-            ConfigOption("width", "spinner", "Width (grid units):", def_w, 1, 128, 1),
-            ConfigOption("height", "spinner", "Height (grid units):", def_h, 1, 128, 1)
-        ]}
+        general_model = _general_model(source_info["name"], def_w, def_h)
         
-        populate_defaults_from_model(self.current_config, source_model)
-        populate_defaults_from_model(self.current_config, displayer_model)
-        populate_defaults_from_model(self.current_config, general_model)
+        # Gather every default first, then merge them into current_config in one go
+        merged = {}
+        populate_defaults_from_model(merged, source_model)
+        populate_defaults_from_model(merged, displayer_model)
+        populate_defaults_from_model(merged, general_model)
         
         if self.selected_displayer_key:
             defaults = config_manager.get_displayer_defaults(self.selected_displayer_key)
             if defaults:
-                self.current_config.update(defaults)
+                merged |= defaults
+        self.current_config |= merged
 
         source_min_val = self.current_config.get('graph_min_value')
         source_max_val = self.current_config.get('graph_max_value')
@@ -210,39 +333,84 @@ class PanelBuilderDialog:
             elif self.selected_displayer_key == 'level_bar':
                 self.current_config['level_min_value'] = source_min_val
                 self.current_config['level_max_value'] = source_max_val
-        
-        build_ui_from_model(self.source_config_box, self.current_config, source_model, self.widgets)
-        build_ui_from_model(self.displayer_config_box, self.current_config, displayer_model, self.widgets)
-        build_ui_from_model(self.general_config_box, self.current_config, general_model, self.widgets)
-        
-        build_background_config_ui(self.general_config_box, self.current_config, self.widgets, self.dialog, prefix="panel_", title="Panel Background")
 
+        self._source_model = source_model
+        self._displayer_model = displayer_model
+        self._general_model = general_model
+
+        # A kept Data Source tab may still be waiting on its custom builder
+        for builder in pending_source:
+            self._queue_custom_builder(builder)
+
+        # The selection can change while a configuration tab is showing
+        self._ensure_tab_built(self.notebook.get_current_page())
+
+    def _build_source_tab(self):
+        self._track_source_additions(build_ui_from_model, self.source_config_box, self.current_config, self._source_model, self.widgets)
+        self._queue_custom_builder(self._build_custom_source)
+
+    def _track_source_additions(self, build_func, *args):
+        """Runs a Data Source tab builder and records the widgets and models it registers."""
+        widget_keys = set(self.widgets)
+        dynamic_count = len(self.dialog.dynamic_models)
+        ui_model_keys = set(self.dialog.ui_models)
+        build_func(*args)
+        self._source_widget_keys.update(self.widgets.keys() - widget_keys)
+        self._source_dynamic_models.extend(self.dialog.dynamic_models[dynamic_count:])
+        for key in self.dialog.ui_models.keys() - ui_model_keys:
+            self._source_ui_models[key] = self.dialog.ui_models[key]
+
+    def _build_displayer_tab(self):
+        # Some displayer builders look up Data Source widgets (e.g. the combo
+        # arc count), so that tab and its custom builder have to come first
+        self._ensure_tab_built(self._source_page)
+        build_ui_from_model(self.displayer_config_box, self.current_config, self._displayer_model, self.widgets)
+        self._queue_custom_builder(self._build_custom_displayer)
+
+    def _queue_custom_builder(self, builder):
+        """
+        Defers a custom-builder page to idle so the combo selection returns
+        immediately. The first queued builder schedules the idle flush.
+        """
+        self._pending_custom_builders.append(builder)
+        if len(self._pending_custom_builders) == 1:
+            GLib.idle_add(self._run_custom_builders, self._rebuild_token, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _run_custom_builders(self, token):
+        # A newer rebuild has replaced the widgets these builders were queued for
+        if token != self._rebuild_token:
+            return GLib.SOURCE_REMOVE
+        pending, self._pending_custom_builders = self._pending_custom_builders, []
+        for builder in pending:
+            builder()
+        return GLib.SOURCE_REMOVE
+
+    def _build_custom_source(self):
         temp_source_instance = self.source_class(config=self.current_config)
         source_custom_builder = temp_source_instance.get_configure_callback()
         if source_custom_builder:
-            source_custom_builder(self.dialog, self.source_config_box, self.widgets, self.AVAILABLE_DATA_SOURCES, self.current_config)
-        
+            self._track_source_additions(source_custom_builder, self.dialog, self.source_config_box, self.widgets, self.AVAILABLE_DATA_SOURCES, self.current_config)
+
+    def _build_custom_displayer(self):
         temp_displayer_instance = self.displayer_class(panel_ref=None, config=self.current_config)
         displayer_custom_builder = temp_displayer_instance.get_configure_callback()
         if displayer_custom_builder:
             displayer_custom_builder(self.dialog, self.displayer_config_box, self.widgets, self.AVAILABLE_DATA_SOURCES, self.current_config)
 
+    def _build_general_tab(self):
+        build_ui_from_model(self.general_config_box, self.current_config, self._general_model, self.widgets)
+        build_background_config_ui(self.general_config_box, self.current_config, self.widgets, self.dialog, prefix="panel_", title="Panel Background")
 
     def _on_create_panel(self, button):
         """Gathers all data and tells the grid manager to create the panel."""
         if not self.source_class or not self.displayer_class:
             return
 
-        source_info = next((s for s in self.AVAILABLE_DATA_SOURCES if s['key'] == self.selected_source_key), None)
-        
-        source_model = self.source_class.get_config_model()
-        displayer_model = self.displayer_class.get_config_model()
-        def_w, def_h = source_info.get("default_size", (2, 2))
-        general_model = { "General Panel Settings": [
-            ConfigOption("title_text", "string", "Panel Title:", source_info["name"]),
-            ConfigOption("width", "spinner", "Width (grid units):", def_w, 1, 128, 1),
-            ConfigOption("height", "spinner", "Height (grid units):", def_h, 1, 128, 1)
-        ]}
+        # Tabs the user never opened still contribute their (default) widget values
+        for page_num in self._tab_builders:
+            self._ensure_tab_built(page_num)
+        self._run_custom_builders(self._rebuild_token)
+        source_model, displayer_model, general_model = self._source_model, self._displayer_model, self._general_model
         
         background_model = self.dialog.ui_models.get('background_panel_', {})
         
@@ -253,27 +421,14 @@ class PanelBuilderDialog:
         final_config['type'] = self.selected_source_key
         final_config['displayer_type'] = self.selected_displayer_key
 
-        if self.selected_source_key == 'system_temp' and not final_config.get('selected_sensor_key'):
-            sensors = SENSOR_CACHE.get('system_temp', {})
+        sensor_config_key = _DEFAULT_SENSOR_KEYS.get(self.selected_source_key)
+        if sensor_config_key and not final_config.get(sensor_config_key):
+            sensors = SENSOR_CACHE.get(self.selected_source_key) or {}
             first_key = next((k for k in sensors if k), None)
-            if first_key: final_config['selected_sensor_key'] = first_key
-        
-        if self.selected_source_key == 'fan_speed' and not final_config.get('selected_fan_key'):
-            sensors = SENSOR_CACHE.get('fan_speed', {})
-            first_key = next((k for k in sensors if k), None)
-            if first_key: final_config['selected_fan_key'] = first_key
+            if first_key: final_config[sensor_config_key] = first_key
 
         if self.selected_source_key == 'combo':
-            if self.selected_displayer_key == 'level_bar_combo':
-                final_config['combo_mode'] = 'level_bar'
-            elif self.selected_displayer_key == 'lcars_combo':
-                final_config['combo_mode'] = 'lcars'
-            elif self.selected_displayer_key == 'arc_combo':
-                final_config['combo_mode'] = 'arc'
-            elif self.selected_displayer_key == 'dashboard_combo':
-                final_config['combo_mode'] = 'dashboard'
-            else:
-                final_config['combo_mode'] = 'arc' # Default fallback
+            final_config['combo_mode'] = _COMBO_MODE.get(self.selected_displayer_key, 'arc') # 'arc' is the default fallback
         
         self.grid_manager.create_and_add_panel_from_config(final_config)
         
@@ -1,6 +1,72 @@
 # sensor_cache.py
 # A simple, shared module to hold discovered sensor data.
 # This avoids circular dependencies between main.py and data_sources.
+#
+# The discovered sensors are also persisted between runs so panels can be
+# built immediately on warm starts while discovery refreshes them.
+import os
+import glob
+import json
+import hashlib
+from gi.repository import GLib
 
 SENSOR_CACHE = {}
 
+cache_home = GLib.get_user_cache_dir()
+if cache_home:
+    SENSOR_CACHE_FILE = os.path.join(cache_home, "gSens", "sensors.json")
+else:
+    SENSOR_CACHE_FILE = os.path.expanduser("~/.cache/gSens/sensors.json")
+
+def _hardware_fingerprint():
+    """
+    Hashes stable hardware identifiers: the CPU model and the hwmon chip names.
+    Volatile /proc/cpuinfo fields such as the current clock are skipped.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    try:
+        with open('/proc/cpuinfo', 'rb') as f:
+            for line in f:
+                if line.startswith(b'model name'):
+                    digest.update(line)
+                    break
+    except OSError:
+        pass
+    for name_path in sorted(glob.glob('/sys/class/hwmon/hwmon*/name')):
+        try:
+            with open(name_path, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            continue
+    return digest.hexdigest()
+
+def load_persisted():
+    """
+    Fills SENSOR_CACHE from the previous run if the hardware is unchanged.
+    Returns True if the cache was loaded.
+    """
+    try:
+        with open(SENSOR_CACHE_FILE, 'r', encoding='utf-8') as f:
+            persisted = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    if not isinstance(persisted, dict) or persisted.get("fingerprint") != _hardware_fingerprint():
+        return False
+    sensors = persisted.get("sensors")
+    if not isinstance(sensors, dict):
+        return False
+    SENSOR_CACHE.update(sensors)
+    return True
+
+def persist():
+    """Writes SENSOR_CACHE to disk atomically for the next run."""
+    data = {"fingerprint": _hardware_fingerprint(), "sensors": dict(SENSOR_CACHE)}
+    tmp_path = f"{SENSOR_CACHE_FILE}.tmp"
+    try:
+        os.makedirs(os.path.dirname(SENSOR_CACHE_FILE), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, SENSOR_CACHE_FILE)
+    except OSError as e:
+        print(f"Warning: Could not write sensor cache {SENSOR_CACHE_FILE}: {e}")
@@ -2,9 +2,29 @@
 # A singleton manager for handling displayer style operations like copy, paste, save, and load.
 
 import configparser
+import io
 import os
 from gi.repository import GLib
 
+# General panel background keys, part of every displayer's style
+_BG_STYLE_KEYS = frozenset({
+    'panel_bg_type', 'panel_bg_color', 'panel_gradient_linear_color1', 
+    'panel_gradient_linear_color2', 'panel_gradient_linear_angle_deg',
+    'panel_gradient_radial_color1', 'panel_gradient_radial_color2',
+    'panel_background_image_path', 'panel_background_image_style', 
+    'panel_background_image_alpha'
+})
+
+# Displayer class -> its config key prefixes as a tuple, ready for str.startswith
+_PREFIX_CACHE = {}
+
+def _config_key_prefixes(displayer_class):
+    prefixes = _PREFIX_CACHE.get(displayer_class)
+    if prefixes is None:
+        get_prefixes = getattr(displayer_class, 'get_config_key_prefixes', None)
+        prefixes = _PREFIX_CACHE[displayer_class] = tuple(get_prefixes()) if get_prefixes else ()
+    return prefixes
+
 class StyleManager:
     """
     Manages a clipboard for displayer styles and handles saving/loading
@@ -29,7 +49,6 @@ class StyleManager:
         if not hasattr(panel, 'data_displayer') or not panel.data_displayer:
             return {}
 
-        style_dict = {}
         displayer = panel.data_displayer
         config = panel.config
         
@@ -38,30 +57,15 @@ class StyleManager:
         
         # Get keys based on registered prefixes. This is still useful for complex
         # displayers that might not list every single dynamic key.
-        if hasattr(displayer, 'get_config_key_prefixes'):
-            prefixes = displayer.get_config_key_prefixes()
-            for key in config:
-                for prefix in prefixes:
-                    if key.startswith(prefix):
-                        model_keys.add(key)
-                        break
+        prefixes = _config_key_prefixes(displayer.__class__)
+        if prefixes:
+            model_keys.update(key for key in config if key.startswith(prefixes))
         
         # Add general panel background keys
-        bg_keys = [
-            'panel_bg_type', 'panel_bg_color', 'panel_gradient_linear_color1', 
-            'panel_gradient_linear_color2', 'panel_gradient_linear_angle_deg',
-            'panel_gradient_radial_color1', 'panel_gradient_radial_color2',
-            'panel_background_image_path', 'panel_background_image_style', 
-            'panel_background_image_alpha'
-        ]
-        model_keys.update(bg_keys)
+        model_keys.update(_BG_STYLE_KEYS)
 
         # Populate the style dictionary with current values from the panel config
-        for key in model_keys:
-            if key in config:
-                style_dict[key] = config[key]
-        
-        return style_dict
+        return {key: config[key] for key in model_keys if key in config}
 
     def copy_style(self, panel):
         """Copies a panel's style configuration to the internal clipboard."""
@@ -90,7 +94,12 @@ class StyleManager:
             print(f"Cannot paste: Style is for '{clipboard_displayer}', panel is '{target_displayer}'.")
             return
 
-        panel.config.update(self.style_clipboard['styles'])
+        styles = self.style_clipboard['styles']
+        if all(panel.config.get(key) == value for key, value in styles.items()):
+            print(f"Style already matches panel '{panel.config.get('id')}', nothing to paste.")
+            return
+
+        panel.config.update(styles)
         panel.apply_all_configurations()
         config_manager_ref.update_panel_config(panel.config["id"], panel.config)
         print(f"Style pasted to panel '{panel.config.get('id')}'.")
@@ -104,18 +113,18 @@ class StyleManager:
 
         styles = self._extract_style_keys(panel)
         
-        style_parser = configparser.ConfigParser()
+        # Raw parser: style values are stored verbatim, so skip interpolation checks
+        style_parser = configparser.RawConfigParser()
         style_parser.optionxform = str
-        style_parser.add_section('Style')
-        style_parser.set('Style', 'displayer_type', displayer_key)
+        style_parser['Style'] = {'displayer_type': displayer_key}
+        style_parser['Keys'] = {key: str(value) for key, value in styles.items()}
         
-        style_parser.add_section('Keys')
-        for key, value in styles.items():
-            style_parser.set('Keys', key, str(value))
+        buf = io.StringIO()
+        style_parser.write(buf)
             
         try:
             with open(filepath, 'w', encoding='utf-8') as f:
-                style_parser.write(f)
+                f.write(buf.getvalue())
             print(f"Style for '{displayer_key}' saved to {filepath}")
             return True
         except IOError as e:
@@ -124,15 +133,22 @@ class StyleManager:
 
     def load_style_from_file(self, filepath, panel, config_manager_ref):
         """Loads a style from a .gss file and applies it to a panel."""
-        if not os.path.exists(filepath):
+        # One open and read; a missing file surfaces here instead of through a separate exists() check
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                style_text = f.read()
+        except FileNotFoundError:
             print(f"Error: Style file not found at {filepath}")
             return
+        except IOError as e:
+            print(f"Error reading style file {filepath}: {e}")
+            return
 
-        style_parser = configparser.ConfigParser(interpolation=None)
+        style_parser = configparser.RawConfigParser()
         style_parser.optionxform = str
         
         try:
-            style_parser.read(filepath, encoding='utf-8')
+            style_parser.read_string(style_text, source=filepath)
             
             file_displayer_type = style_parser.get('Style', 'displayer_type')
             panel_displayer_type = panel.config.get('displayer_type')
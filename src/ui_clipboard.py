@@ -3,16 +3,15 @@
 
 class FontClipboard:
     """
-    A singleton to manage a global font clipboard for the application.
-    It is initialized with a default font to ensure it's never empty.
+    Manages the global font clipboard for the application; use the shared
+    font_clipboard instance below. It is initialized with a default font to
+    ensure it's never empty.
     """
-    _instance = None
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(FontClipboard, cls).__new__(cls)
-            # Initialize with a default font
-            cls._instance.clipboard_font = "Sans 12"
-        return cls._instance
+    __slots__ = ('clipboard_font',)
+
+    def __init__(self):
+        # Initialize with a default font
+        self.clipboard_font = "Sans 12"
 
     def copy_font(self, font_string):
         """Copies a font string to the clipboard."""
@@ -24,16 +23,15 @@ class FontClipboard:
 
 class ColorClipboard:
     """
-    A singleton to manage a global color clipboard for the application.
-    It is initialized with a default color to ensure it's never empty.
+    Manages the global color clipboard for the application; use the shared
+    color_clipboard instance below. It is initialized with a default color to
+    ensure it's never empty.
     """
-    _instance = None
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(ColorClipboard, cls).__new__(cls)
-            # Initialize with a default color (white)
-            cls._instance.clipboard_color = "rgba(255,255,255,1)"
-        return cls._instance
+    __slots__ = ('clipboard_color',)
+
+    def __init__(self):
+        # Initialize with a default color (white)
+        self.clipboard_color = "rgba(255,255,255,1)"
 
     def copy_color(self, rgba_string):
         """Copies a color RGBA string to the clipboard."""
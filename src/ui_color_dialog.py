@@ -3,11 +3,88 @@ import gi
 import math
 import cairo
 import colorsys
+import re
 gi.require_version("Gtk", "4.0")
-from gi.repository import Gtk, Gdk, GLib, Pango, Gio
-from ui_helpers import CustomDialog
+from gi.repository import Gtk, Gdk, GLib
 from config_manager import config_manager
 
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+# Slider channel -> (Gdk.RGBA field, slider upper bound)
+_SLIDER_CHANNELS = {'Red': ('red', 255.0), 'Green': ('green', 255.0), 'Blue': ('blue', 255.0), 'Alpha': ('alpha', 100.0)}
+# The rgb()/rgba() form written by Gdk.RGBA.to_string(), e.g. custom colors in theme.ini
+_RGBA_RE = re.compile(r"rgba?\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*(?:,\s*([\d.]+)\s*)?\)")
+
+def _parse_color(text):
+    """
+    Parses a color string into a new Gdk.RGBA, or returns None. #rgb, #rgba,
+    #rrggbb, #rrggbbaa and plain rgb()/rgba() are decoded directly; anything
+    else goes through Gdk.RGBA.parse.
+    """
+    match = _RGBA_RE.fullmatch(text)
+    if match:
+        try:
+            # Clamped like the CSS parser does
+            r, g, b = (min(float(v) / 255.0, 1.0) for v in match.group(1, 2, 3))
+            a = min(float(match.group(4)), 1.0) if match.group(4) is not None else 1.0
+            return Gdk.RGBA(r, g, b, a)
+        except ValueError:
+            pass # e.g. "1.2.3"; let GDK decide
+    if text.startswith("#") and len(text) in (4, 5, 7, 9) and not text[1:].strip(_HEX_DIGITS):
+        digits = text[1:]
+        if len(digits) <= 4:
+            # Short form: each nibble stands for a doubled digit, e.g. f -> ff
+            channels = [int(c, 16) * 17 for c in digits]
+        else:
+            channels = list(int(digits, 16).to_bytes(len(digits) // 2, "big"))
+        if len(channels) == 3:
+            channels.append(255)
+        r, g, b, a = channels
+        return Gdk.RGBA(r / 255.0, g / 255.0, b / 255.0, a / 255.0)
+    rgba = Gdk.RGBA()
+    return rgba if rgba.parse(text) else None
+
+def _format_hex(rgba):
+    """Formats a Gdk.RGBA as #RRGGBB, or #RRGGBBAA when it is not (nearly) opaque."""
+    channels = [int(rgba.red * 255), int(rgba.green * 255), int(rgba.blue * 255)]
+    if rgba.alpha < 0.99:
+        channels.append(int(rgba.alpha * 255))
+    return "#" + bytes(channels).hex().upper()
+
+def _build_stock_colors():
+    # 8 Columns: Purple, Blue, Cyan, Green, Yellow, Orange, Red, Gray
+    hues = [270, 240, 180, 120, 60, 30, 0, -1]
+    colors = []
+    for row in range(8):
+        # Lightness 0.95 down to 0.25
+        lightness = 0.95 - (row * 0.1)
+        for hue in hues:
+            if hue == -1:
+                g = 0.98 - (row * (0.98 / 7.0)) # White to black
+                colors.append((g, g, g))
+            else:
+                colors.append(colorsys.hls_to_rgb(hue/360.0, lightness, 0.85))
+    return tuple(colors)
+
+# The 8x8 stock palette as (r, g, b) tuples, row by row
+_STOCK_COLORS = _build_stock_colors()
+
+# Swatches are plain boxes painted by GTK from CSS. Every swatch gets its own
+# class, and all rules live in one provider that is reloaded as a whole.
+SWATCH_CSS_CLASS = "gsens-swatch"
+# Light squares of a 2x2 checkerboard (top-left, bottom-right) over the gray background-color
+_SWATCH_CHECKER = ("linear-gradient(to right, white 50%, transparent 50%), "
+                   "linear-gradient(to right, transparent 50%, white 50%)")
+_SWATCH_BASE_CSS = (
+    f".{SWATCH_CSS_CLASS} {{ background-color: #b3b3b3; background-image: {_SWATCH_CHECKER}; "
+    "background-size: 100% 100%, 100% 50%, 100% 50%; background-position: center, top, bottom; "
+    "background-repeat: no-repeat; border: 1px solid rgba(0,0,0,0.2); }"
+)
+# The hue scale's trough shows the full hue circle; GTK renders and caches it
+_HUE_SLIDER_CSS = (
+    "scale.hue-slider trough { background: linear-gradient(to right, #ff0000 0%, #ffff00 16.67%, "
+    "#00ff00 33.33%, #00ffff 50%, #0000ff 66.67%, #ff00ff 83.33%, #ff0000 100%); }"
+)
+
 class ColorChooserDialog(Gtk.Window):
     """
     A unified custom color chooser featuring:
@@ -17,6 +94,7 @@ class ColorChooserDialog(Gtk.Window):
     - RGBA Sliders & Hex Entry
     """
     _instance = None
+    CUSTOM_COLOR_SLOTS = 32
 
     def __new__(cls, parent=None):
         if cls._instance is None:
@@ -40,20 +118,42 @@ class ColorChooserDialog(Gtk.Window):
         self._current_hsv = (0, 0, 1) # H, S, V
         self._callback_func = None
         self._active_button_ref = None
-        self._updating_inputs = False
-        
-        self._build_ui()
-        self._load_custom_colors()
+        # Signal handler ids, blocked while the inputs are set programmatically
+        self._slider_scales = {}
+        self._slider_handlers = {}
+        self._hue_handler = None
+        # Offscreen buffers at device resolution, keyed on (w, h, scale) and
+        # repainted in place when only their content changes
+        self._map_surface = None
+        self._map_surface_key = None
+        self._map_hue = None
+        self._preview_surface = None
+        self._preview_surface_key = None
+        self._preview_color = None
+        # Latest map drag point, applied by a frame-clock tick callback while dragging
+        self._pending_map_xy = None
+        self._map_tick_id = None
+        self._redraw_pending = False
+        # The widget tree is built on first present_for_widget()
+        self._built = False
         
         self.connect("close-request", self._on_close_request)
         self._initialized = True
 
+    def _ensure_built(self):
+        if self._built:
+            return
+        self._build_ui()
+        self._load_custom_colors()
+        self._built = True
+
     def present_for_widget(self, widget, current_color_str, callback):
+        self._ensure_built()
         self._active_button_ref = widget
         self._callback_func = callback
         try:
-            rgba = Gdk.RGBA()
-            if rgba.parse(current_color_str):
+            rgba = _parse_color(current_color_str)
+            if rgba:
                 self._set_color_internal(rgba, update_inputs=True)
         except: pass 
         self.set_transient_for(widget.get_ancestor(Gtk.Window))
@@ -64,6 +164,10 @@ class ColorChooserDialog(Gtk.Window):
         return True
 
     def _build_ui(self):
+        self._swatch_rules = []
+        self._css_provider = Gtk.CssProvider()
+        Gtk.StyleContext.add_provider_for_display(Gdk.Display.get_default(), self._css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+
         # Main Horizontal Layout - Reduced padding/spacing
         main_hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12, margin_top=12, margin_bottom=12, margin_start=12, margin_end=12)
         self.set_child(main_hbox)
@@ -98,6 +202,9 @@ class ColorChooserDialog(Gtk.Window):
         self.custom_grid.set_column_spacing(1)
         self.custom_grid.set_valign(Gtk.Align.START)
         left_vbox.append(self.custom_grid)
+        # Created once; _load_custom_colors only recolors them
+        self._custom_slots = [self._create_swatch_button(self.custom_grid, Gdk.RGBA(0, 0, 0, 0))
+                              for _ in range(self.CUSTOM_COLOR_SLOTS)]
 
         # --- RIGHT COLUMN: MAP & SLIDERS ---
         right_vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
@@ -112,6 +219,7 @@ class ColorChooserDialog(Gtk.Window):
         click_gesture.connect("pressed", self._on_map_input)
         drag_gesture = Gtk.GestureDrag.new()
         drag_gesture.connect("drag-update", self._on_map_drag)
+        drag_gesture.connect("drag-end", self._on_map_drag_end)
         self.map_area.add_controller(click_gesture)
         self.map_area.add_controller(drag_gesture)
         
@@ -124,7 +232,7 @@ class ColorChooserDialog(Gtk.Window):
         self.hue_scale = Gtk.Scale(orientation=Gtk.Orientation.HORIZONTAL, adjustment=hue_adj)
         self.hue_scale.set_draw_value(False)
         self.hue_scale.add_css_class("hue-slider")
-        self.hue_scale.connect("value-changed", self._on_hue_changed)
+        self._hue_handler = self.hue_scale.connect("value-changed", self._on_hue_changed)
         right_vbox.append(self.hue_scale)
 
         # Sliders
@@ -140,7 +248,8 @@ class ColorChooserDialog(Gtk.Window):
             scale.set_size_request(140, -1)
             scale.set_draw_value(True)
             scale.set_value_pos(Gtk.PositionType.RIGHT)
-            scale.connect("value-changed", self._on_slider_changed, channel)
+            self._slider_handlers[channel] = scale.connect("value-changed", self._on_slider_changed, channel)
+            self._slider_scales[channel] = scale
             
             grid.attach(label, 0, i, 1, 1)
             grid.attach(scale, 1, i, 1, 1)
@@ -202,40 +311,53 @@ class ColorChooserDialog(Gtk.Window):
                 print(f"Picker failed: {e}")
 
     def _add_stock_colors(self, flowbox):
-        # 8 Columns: Purple, Blue, Cyan, Green, Yellow, Orange, Red, Gray
-        hues = [270, 240, 180, 120, 60, 30, 0, -1]
-        
-        for row in range(8):
-            # Lightness 0.95 down to 0.25
-            lightness = 0.95 - (row * 0.1)
-            for hue in hues:
-                if hue == -1:
-                    g = 0.98 - (row * (0.98 / 7.0)) # White to black
-                    rgba = Gdk.RGBA(g, g, g, 1.0)
-                else:
-                    r, g, b = self._hsl_to_rgb(hue/360.0, 0.85, lightness)
-                    rgba = Gdk.RGBA(r, g, b, 1.0)
-                
-                self._create_swatch_button(flowbox, rgba)
+        for r, g, b in _STOCK_COLORS:
+            self._create_swatch_button(flowbox, Gdk.RGBA(r, g, b, 1.0))
 
     def _create_swatch_button(self, container, rgba):
+        """
+        Adds a swatch button and returns its slot, a mutable [rgba, index] holder
+        the click handler reads, so it can be recolored in place. The swatch CSS
+        is loaded separately by _load_dialog_css().
+        """
         btn = Gtk.Button()
         btn.set_size_request(30, 22) 
         btn.add_css_class("flat")
-        area = Gtk.DrawingArea()
-        area.set_draw_func(self._draw_swatch, rgba)
-        btn.set_child(area)
-        btn.connect("clicked", lambda b: self._set_color_internal(rgba, update_inputs=True))
+        index = len(self._swatch_rules)
+        slot = [rgba, index]
+        self._swatch_rules.append(self._swatch_rule(index, rgba))
+        swatch = Gtk.Box(hexpand=True, vexpand=True)
+        swatch.add_css_class(SWATCH_CSS_CLASS)
+        swatch.add_css_class(f"{SWATCH_CSS_CLASS}-{index}")
+        btn.set_child(swatch)
+        # Hand out a copy: the sliders edit the current color in place
+        btn.connect("clicked", lambda b: self._set_color_internal(slot[0].copy(), update_inputs=True))
         container.append(btn)
+        return slot
+
+    @staticmethod
+    def _swatch_rule(index, rgba):
+        color = rgba.to_string()
+        return (f"box.{SWATCH_CSS_CLASS}-{index} {{ background-image: "
+                f"linear-gradient({color}, {color}), {_SWATCH_CHECKER}; }}")
+
+    def _set_swatch_color(self, slot, rgba):
+        slot[0] = rgba
+        self._swatch_rules[slot[1]] = self._swatch_rule(slot[1], rgba)
+
+    def _load_dialog_css(self):
+        css_data = " ".join((_HUE_SLIDER_CSS, _SWATCH_BASE_CSS, *self._swatch_rules))
+        try:
+            self._css_provider.load_from_data(css_data.encode())
+        except GLib.Error as e:
+            print(f"Color dialog CSS parse error: {e}")
 
     def _load_custom_colors(self):
-        child = self.custom_grid.get_first_child()
-        while child: self.custom_grid.remove(child); child = self.custom_grid.get_first_child()
         saved_colors = config_manager.get_custom_colors()
         self._custom_color_data = saved_colors
-        for color_str in saved_colors:
-            rgba = Gdk.RGBA(); rgba.parse(color_str)
-            self._create_swatch_button(self.custom_grid, rgba)
+        for slot, color_str in zip(self._custom_slots, saved_colors):
+            self._set_swatch_color(slot, _parse_color(color_str) or Gdk.RGBA())
+        self._load_dialog_css()
 
     def _on_save_custom_clicked(self, btn):
         current_str = self._current_rgba.to_string()
@@ -244,29 +366,71 @@ class ColorChooserDialog(Gtk.Window):
         config_manager.save_custom_colors(self._custom_color_data)
         self._load_custom_colors()
 
-    def _draw_swatch(self, area, ctx, w, h, rgba):
+    def _draw_swatch(self, area, ctx, w, h, color):
+        """Draws a checkered swatch; color is an (r, g, b, a) tuple."""
         ctx.set_source_rgb(0.7, 0.7, 0.7); ctx.rectangle(0, 0, w, h); ctx.fill()
         ctx.set_source_rgb(1.0, 1.0, 1.0); ctx.rectangle(0, 0, w/2, h/2); ctx.rectangle(w/2, h/2, w/2, h/2); ctx.fill()
-        ctx.set_source_rgba(rgba.red, rgba.green, rgba.blue, rgba.alpha); ctx.rectangle(0, 0, w, h); ctx.fill()
+        ctx.set_source_rgba(*color); ctx.rectangle(0, 0, w, h); ctx.fill()
         ctx.set_source_rgba(0, 0, 0, 0.2); ctx.set_line_width(1); ctx.rectangle(0.5, 0.5, w-1, h-1); ctx.stroke()
 
+    @staticmethod
+    def _create_scaled_surface(fmt, w, h, scale):
+        """Creates an image surface for a w x h logical area at device resolution."""
+        surface = cairo.ImageSurface(fmt, w * scale, h * scale)
+        surface.set_device_scale(scale, scale)
+        return surface
+
     def _draw_preview(self, area, ctx, w, h):
-        self._draw_swatch(area, ctx, w, h, self._current_rgba)
+        rgba = self._current_rgba
+        color = (rgba.red, rgba.green, rgba.blue, rgba.alpha)
+        # Back buffer: re-render only when the color or size changed, not on every expose.
+        # Keyed on the color itself since the sliders and map edit _current_rgba in place.
+        size_key = (w, h, area.get_scale_factor())
+        if self._preview_surface is None or self._preview_surface_key != size_key:
+            self._preview_surface = self._create_scaled_surface(cairo.FORMAT_ARGB32, *size_key)
+            self._preview_surface_key = size_key
+            self._preview_color = None
+        if self._preview_color != color:
+            # The checker background is opaque, so repainting overwrites the old color
+            self._draw_swatch(area, cairo.Context(self._preview_surface), w, h, color)
+            self._preview_color = color
+        ctx.set_source_surface(self._preview_surface, 0, 0)
+        ctx.paint()
+
+    def _render_color_map(self, surface, w, h, hue):
+        """Rasterizes the saturation/value mesh for a hue into the offscreen map surface."""
+        r, g, b = colorsys.hls_to_rgb(hue, 0.5, 1.0)
+        
+        surface_ctx = cairo.Context(surface)
+        
+        # For a fixed hue, HSV is bilinear: white -> pure hue along saturation,
+        # then scaled towards black along value. Two linear gradients give the
+        # same result as a four-corner mesh without the mesh rasterizer.
+        saturation = cairo.LinearGradient(0, 0, w, 0)
+        saturation.add_color_stop_rgb(0, 1, 1, 1)
+        saturation.add_color_stop_rgb(1, r, g, b)
+        surface_ctx.set_source(saturation)
+        surface_ctx.paint()
+        
+        value = cairo.LinearGradient(0, 0, 0, h)
+        value.add_color_stop_rgba(0, 0, 0, 0, 0)
+        value.add_color_stop_rgba(1, 0, 0, 0, 1)
+        surface_ctx.set_source(value)
+        surface_ctx.paint()
 
     def _draw_color_map(self, area, ctx, w, h):
         hue = self._current_hsv[0]
-        r, g, b = self._hsl_to_rgb(hue, 1.0, 0.5)
+        # The mesh only depends on hue and size, so SV drags just blit the cached surface
+        size_key = (w, h, area.get_scale_factor())
+        if self._map_surface is None or self._map_surface_key != size_key:
+            self._map_surface = self._create_scaled_surface(cairo.FORMAT_RGB24, *size_key)
+            self._map_surface_key = size_key
+            self._map_hue = None
+        if self._map_hue != hue:
+            self._render_color_map(self._map_surface, w, h, hue)
+            self._map_hue = hue
         
-        pat = cairo.MeshPattern()
-        pat.begin_patch()
-        pat.move_to(0, 0); pat.line_to(w, 0); pat.line_to(w, h); pat.line_to(0, h)
-        pat.set_corner_color_rgb(0, 1, 1, 1) # TL
-        pat.set_corner_color_rgb(1, r, g, b) # TR
-        pat.set_corner_color_rgb(2, 0, 0, 0) # BR
-        pat.set_corner_color_rgb(3, 0, 0, 0) # BL
-        pat.end_patch()
-        
-        ctx.set_source(pat)
+        ctx.set_source_surface(self._map_surface, 0, 0)
         ctx.paint()
         
         s, v = self._current_hsv[1], self._current_hsv[2]
@@ -274,81 +438,78 @@ class ColorChooserDialog(Gtk.Window):
         ctx.set_source_rgb(1, 1, 1) if v < 0.5 else ctx.set_source_rgb(0, 0, 0)
         ctx.arc(sel_x, sel_y, 4, 0, 2*math.pi); ctx.stroke()
 
-    def _hsl_to_rgb(self, h, s, l):
-        def hue_to_rgb(p, q, t):
-            if t < 0: t += 1
-            if t > 1: t -= 1
-            if t < 1/6: return p + (q - p) * 6 * t
-            if t < 1/2: return q
-            if t < 2/3: return p + (q - p) * (2/3 - t) * 6
-            return p
-        if s == 0: r, g, b = l, l, l
-        else:
-            q = l * (1 + s) if l < 0.5 else l + s - l * s
-            p = 2 * l - q
-            r = hue_to_rgb(p, q, h + 1/3)
-            g = hue_to_rgb(p, q, h)
-            b = hue_to_rgb(p, q, h - 1/3)
-        return r, g, b
-
-    def _rgb_to_hsv(self, r, g, b):
-        return colorsys.rgb_to_hsv(r, g, b)
-        
-    def _hsv_to_rgb(self, h, s, v):
-        return colorsys.hsv_to_rgb(h, s, v)
+    def _block_input_handlers(self, block):
+        """Blocks or unblocks the slider and hue handlers so GTK skips them entirely."""
+        for channel, handler_id in self._slider_handlers.items():
+            scale = self._slider_scales[channel]
+            if block: scale.handler_block(handler_id)
+            else: scale.handler_unblock(handler_id)
+        if block: self.hue_scale.handler_block(self._hue_handler)
+        else: self.hue_scale.handler_unblock(self._hue_handler)
 
     def _update_from_rgba(self):
-        self._updating_inputs = True
-        self.sliders['Red'].set_value(self._current_rgba.red * 255)
-        self.sliders['Green'].set_value(self._current_rgba.green * 255)
-        self.sliders['Blue'].set_value(self._current_rgba.blue * 255)
-        self.sliders['Alpha'].set_value(self._current_rgba.alpha * 100)
+        self._block_input_handlers(True)
+        # Read the boxed RGBA fields once
+        rgba = self._current_rgba
+        r, g, b, a = rgba.red, rgba.green, rgba.blue, rgba.alpha
+        self.sliders['Red'].set_value(r * 255)
+        self.sliders['Green'].set_value(g * 255)
+        self.sliders['Blue'].set_value(b * 255)
+        self.sliders['Alpha'].set_value(a * 100)
         
-        r, g, b = int(self._current_rgba.red*255), int(self._current_rgba.green*255), int(self._current_rgba.blue*255)
-        if self._current_rgba.alpha >= 0.99: self.hex_entry.set_text(f"#{r:02X}{g:02X}{b:02X}")
-        else: a = int(self._current_rgba.alpha * 255); self.hex_entry.set_text(f"#{r:02X}{g:02X}{b:02X}{a:02X}")
+        self._sync_hex_entry()
         
-        h, s, v = self._rgb_to_hsv(self._current_rgba.red, self._current_rgba.green, self._current_rgba.blue)
+        h, s, v = colorsys.rgb_to_hsv(r, g, b)
         self._current_hsv = (h, s, v)
         self.hue_scale.set_value(h * 360)
         
-        self.preview_area.queue_draw()
-        self.map_area.queue_draw()
-        self._updating_inputs = False
+        self._schedule_redraw()
+        self._block_input_handlers(False)
+
+    def _sync_hex_entry(self):
+        """Shows the current color in the hex entry, skipping set_text when the text is unchanged."""
+        # Compared against the entry itself, not a cached string, so user edits are never masked
+        hex_str = _format_hex(self._current_rgba)
+        if self.hex_entry.get_text() != hex_str:
+            self.hex_entry.set_text(hex_str)
 
     def _set_color_internal(self, rgba, update_inputs=False):
         self._current_rgba = rgba
         if update_inputs: self._update_from_rgba()
-        else:
-            self.preview_area.queue_draw()
-            self.map_area.queue_draw()
+        else: self._schedule_redraw()
+
+    def _schedule_redraw(self):
+        """Batches preview and map invalidations into one flush per main-loop pass."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            # High idle runs ahead of GTK's redraw priority, so no frame is skipped
+            GLib.idle_add(self._flush_redraw, priority=GLib.PRIORITY_HIGH_IDLE)
+
+    def _flush_redraw(self):
+        self._redraw_pending = False
+        self.preview_area.queue_draw()
+        self.map_area.queue_draw()
+        return GLib.SOURCE_REMOVE
 
     def _on_slider_changed(self, scale, channel):
-        if self._updating_inputs: return
-        val = scale.get_value()
-        if channel == 'Red': self._current_rgba.red = val / 255.0
-        elif channel == 'Green': self._current_rgba.green = val / 255.0
-        elif channel == 'Blue': self._current_rgba.blue = val / 255.0
-        elif channel == 'Alpha': self._current_rgba.alpha = val / 100.0
+        field, scale_max = _SLIDER_CHANNELS[channel]
+        rgba = self._current_rgba
+        setattr(rgba, field, scale.get_value() / scale_max)
         
-        h, s, v = self._rgb_to_hsv(self._current_rgba.red, self._current_rgba.green, self._current_rgba.blue)
+        h, s, v = colorsys.rgb_to_hsv(rgba.red, rgba.green, rgba.blue)
         self._current_hsv = (h, s, v)
-        self._updating_inputs = True
-        self.hue_scale.set_value(h * 360)
-        self._updating_inputs = False
+        with self.hue_scale.handler_block(self._hue_handler):
+            self.hue_scale.set_value(h * 360)
         
         self._set_color_internal(self._current_rgba, update_inputs=False)
         
-        r, g, b = int(self._current_rgba.red*255), int(self._current_rgba.green*255), int(self._current_rgba.blue*255)
-        hex_str = f"#{r:02X}{g:02X}{b:02X}" if self._current_rgba.alpha >= 0.99 else f"#{r:02X}{g:02X}{b:02X}{int(self._current_rgba.alpha*255):02X}"
-        self.hex_entry.set_text(hex_str)
+        self._sync_hex_entry()
 
     def _on_hue_changed(self, scale):
-        if self._updating_inputs: return
         h_val = scale.get_value() / 360.0
         s, v = self._current_hsv[1], self._current_hsv[2]
         self._current_hsv = (h_val, s, v)
-        r, g, b = self._hsv_to_rgb(h_val, s, v)
+        r, g, b = colorsys.hsv_to_rgb(h_val, s, v)
         self._current_rgba.red, self._current_rgba.green, self._current_rgba.blue = r, g, b
         self._update_from_rgba()
 
@@ -356,8 +517,29 @@ class ColorChooserDialog(Gtk.Window):
         self._update_from_map(x, y)
     
     def _on_map_drag(self, gesture, offset_x, offset_y):
+        # Only remember the latest point; the frame clock applies it once per frame
         res, start_x, start_y = gesture.get_start_point()
-        if res: self._update_from_map(start_x + offset_x, start_y + offset_y)
+        if not res: return
+        self._pending_map_xy = (start_x + offset_x, start_y + offset_y)
+        if self._map_tick_id is None:
+            self._map_tick_id = self.map_area.add_tick_callback(self._on_map_tick)
+
+    def _on_map_tick(self, widget, frame_clock):
+        self._apply_pending_map_point()
+        return GLib.SOURCE_CONTINUE
+
+    def _on_map_drag_end(self, gesture, offset_x, offset_y):
+        if self._map_tick_id is not None:
+            self.map_area.remove_tick_callback(self._map_tick_id)
+            self._map_tick_id = None
+        # The release point may not have reached a tick yet
+        self._apply_pending_map_point()
+
+    def _apply_pending_map_point(self):
+        if self._pending_map_xy is not None:
+            x, y = self._pending_map_xy
+            self._pending_map_xy = None
+            self._update_from_map(x, y)
 
     def _update_from_map(self, x, y):
         w, h = self.map_area.get_width(), self.map_area.get_height()
@@ -365,14 +547,13 @@ class ColorChooserDialog(Gtk.Window):
         s = max(0, min(1, x / w))
         v = max(0, min(1, 1 - (y / h)))
         self._current_hsv = (self._current_hsv[0], s, v)
-        r, g, b = self._hsv_to_rgb(self._current_hsv[0], s, v)
+        r, g, b = colorsys.hsv_to_rgb(self._current_hsv[0], s, v)
         self._current_rgba.red, self._current_rgba.green, self._current_rgba.blue = r, g, b
         self._update_from_rgba()
 
     def _on_hex_entry_changed(self, entry):
-        text = entry.get_text()
-        rgba = Gdk.RGBA()
-        if rgba.parse(text): self._set_color_internal(rgba, update_inputs=True)
+        rgba = _parse_color(entry.get_text())
+        if rgba: self._set_color_internal(rgba, update_inputs=True)
 
     def _on_select_clicked(self, btn):
         if self._callback_func: self._callback_func(self._current_rgba.to_string())
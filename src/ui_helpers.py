@@ -285,6 +285,7 @@ class CustomDialog(Gtk.Window):
 
         self._response = Gtk.ResponseType.NONE
         self._loop = None
+        self._response_callback = None
         self.is_modal = modal
 
         if parent:
@@ -339,6 +340,11 @@ class CustomDialog(Gtk.Window):
             print("Warning: respond() called on a non-modal dialog.")
             return
         self._response = response_id
+        if self._response_callback:
+            callback, self._response_callback = self._response_callback, None
+            self.destroy()
+            callback(response_id)
+            return
         if self._loop and self._loop.is_running():
             self._loop.quit()
 		
@@ -353,6 +359,17 @@ class CustomDialog(Gtk.Window):
         self.destroy()
         return response
 
+    def run_async(self, callback):
+        """
+        Presents the dialog without blocking and calls callback(response_id)
+        once the user responds. The dialog is destroyed before the callback runs.
+        """
+        if not self.is_modal:
+            print("Warning: run_async() called on a non-modal dialog. This is not supported.")
+            return
+        self._response_callback = callback
+        self.present()
+
     def _on_close_request(self, window):
         self.respond(Gtk.ResponseType.CANCEL)
         return True